@@ -5,42 +5,107 @@ Supports reading and setting joint states for both arms.
 """
 
 import argparse
+import math
 import sys
 from Robotic_Arm.rm_robot_interface import *
 
+from .tcp import enable_tcp_nodelay
+
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+
+class _ArmSession:
+    """
+    Process-wide cache of connected arms, keyed by (ip, port).
+    
+    Creating a RoboticArm in triple mode starts the SDK's worker threads and
+    connecting takes a few hundred milliseconds, so controllers created one
+    after another in the same process (REPL, notebooks, scripted experiments)
+    reuse the existing connection instead of reconnecting.
+    """
+    _sessions = {}
+    
+    @classmethod
+    def get(cls, ip, port):
+        """Return the cached (robot, handle) for an arm, or None."""
+        return cls._sessions.get((ip, port))
+    
+    @classmethod
+    def connect(cls, ip, port):
+        """
+        Connect to an arm and cache the session on success.
+        
+        Returns:
+            (robot, handle); handle is None if the connection failed (the SDK
+            reports failure as a handle with id -1), and nothing is cached
+        """
+        robot = RoboticArm(rm_thread_mode_e.RM_TRIPLE_MODE_E)
+        handle = robot.rm_create_robot_arm(ip, port)
+        if not handle or handle.id == -1:
+            return robot, None
+        enable_tcp_nodelay(ip, port)
+        cls._sessions[(ip, port)] = (robot, handle)
+        return robot, handle
+
 
 class DualArmController:
     def __init__(self, arm1_ip="169.254.128.18", arm1_port=8080, 
                  arm2_ip="169.254.128.19", arm2_port=8080):
         """Initialize connection to two robotic arms."""
-        self.robot = RoboticArm(rm_thread_mode_e.RM_TRIPLE_MODE_E)
+        # Each arm needs its own RoboticArm instance: rm_create_robot_arm binds
+        # the instance to a single arm, so sharing one would target the last arm.
+        # Instances are created (or reused from _ArmSession) in connect().
+        self.robot = None
+        self.robot2 = None
         self.arm1_ip = arm1_ip
         self.arm1_port = arm1_port
         self.arm2_ip = arm2_ip
         self.arm2_port = arm2_port
         self.arm1 = None
         self.arm2 = None
+    
+    def __enter__(self):
+        if not self.connect():
+            raise ConnectionError("Failed to connect to robotic arms")
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+        return False
+    
+    def _connect_arm(self, arm_num, ip, port):
+        """Connect to one arm, reusing a cached session if available."""
+        print(f"Connecting to Arm {arm_num} at {ip}:{port}...")
+        session = _ArmSession.get(ip, port)
+        if session is not None:
+            robot, handle = session
+            print(f"✓ Reusing connection to Arm {arm_num} (ID: {handle.id})")
+            return robot, handle
+        
+        robot, handle = _ArmSession.connect(ip, port)
+        if handle:
+            print(f"✓ Connected to Arm {arm_num} (ID: {handle.id})")
+        else:
+            print(f"✗ Failed to connect to Arm {arm_num}")
+        return robot, handle
         
     def connect(self):
         """Connect to both robotic arms."""
-        print(f"Connecting to Arm 1 at {self.arm1_ip}:{self.arm1_port}...")
-        self.arm1 = self.robot.rm_create_robot_arm(self.arm1_ip, self.arm1_port)
-        if self.arm1:
-            print(f"✓ Connected to Arm 1 (ID: {self.arm1.id})")
-        else:
-            print("✗ Failed to connect to Arm 1")
+        self.robot, self.arm1 = self._connect_arm(1, self.arm1_ip, self.arm1_port)
+        if not self.arm1:
             return False
             
-        print(f"Connecting to Arm 2 at {self.arm2_ip}:{self.arm2_port}...")
-        self.arm2 = self.robot.rm_create_robot_arm(self.arm2_ip, self.arm2_port)
-        if self.arm2:
-            print(f"✓ Connected to Arm 2 (ID: {self.arm2.id})")
-        else:
-            print("✗ Failed to connect to Arm 2")
+        self.robot2, self.arm2 = self._connect_arm(2, self.arm2_ip, self.arm2_port)
+        if not self.arm2:
             return False
             
         return True
     
+    def _robot_for(self, arm_num):
+        """Return the RoboticArm instance connected to the given arm (1 or 2)."""
+        return self.robot2 if arm_num == 2 else self.robot
+    
     def read_joint_states(self, arm_num=None):
         """
         Read joint states from one or both arms.
@@ -48,27 +113,15 @@ class DualArmController:
         Args:
             arm_num: 1 for arm1, 2 for arm2, None for both
         """
-        if arm_num is None or arm_num == 1:
-            result = self.robot.rm_get_current_arm_state()
+        for num in ((1, 2) if arm_num is None else (arm_num,)):
+            result = self._robot_for(num).rm_get_current_arm_state()
             if result[0] == 0:
                 joint_data = result[1]['joint']
-                print("\n=== Arm 1 Joint States ===")
+                print(f"\n=== Arm {num} Joint States ===")
                 for i, angle in enumerate(joint_data, 1):
-                    print(f"  Joint {i}: {angle:.4f} rad ({angle * 180 / 3.14159:.2f}°)")
+                    print(f"  Joint {i}: {angle:.4f} rad ({angle * _RAD2DEG:.2f}°)")
             else:
-                print(f"\n✗ Failed to read Arm 1 joint states, Error code: {result[0]}")
-        
-        if arm_num is None or arm_num == 2:
-            # Switch to arm 2 if needed
-            if arm_num == 2 or arm_num is None:
-                result = self.robot.rm_get_current_arm_state()
-                if result[0] == 0:
-                    joint_data = result[1]['joint']
-                    print("\n=== Arm 2 Joint States ===")
-                    for i, angle in enumerate(joint_data, 1):
-                        print(f"  Joint {i}: {angle:.4f} rad ({angle * 180 / 3.14159:.2f}°)")
-                else:
-                    print(f"\n✗ Failed to read Arm 2 joint states, Error code: {result[0]}")
+                print(f"\n✗ Failed to read Arm {num} joint states, Error code: {result[0]}")
     
     def set_joint_states(self, joint_angles, arm_num, speed=20, block=True):
         """
@@ -87,10 +140,10 @@ class DualArmController:
         arm_name = f"Arm {arm_num}"
         print(f"\nSetting joint states for {arm_name}...")
         print(f"Target angles (rad): {[f'{a:.4f}' for a in joint_angles]}")
-        print(f"Target angles (deg): {[f'{a * 180 / 3.14159:.2f}' for a in joint_angles]}")
+        print(f"Target angles (deg): {[f'{a * _RAD2DEG:.2f}' for a in joint_angles]}")
         
         # Use rm_movej to move to joint positions
-        result = self.robot.rm_movej(joint_angles, speed, 0, block)
+        result = self._robot_for(arm_num).rm_movej(joint_angles, speed, 0, block)
         
         if result == 0:
             print(f"✓ Successfully set joint states for {arm_name}")
@@ -102,7 +155,7 @@ class DualArmController:
     def get_arm_info(self, arm_num):
         """Get software information for a specific arm."""
         print(f"\n=== Arm {arm_num} Information ===")
-        software_info = self.robot.rm_get_arm_software_info()
+        software_info = self._robot_for(arm_num).rm_get_arm_software_info()
         if software_info[0] == 0:
             print(f"  Model: {software_info[1]['product_version']}")
             print(f"  Algorithm Version: {software_info[1]['algorithm_info']['version']}")
@@ -114,7 +167,8 @@ class DualArmController:
     def disconnect(self):
         """Disconnect from both arms."""
         print("\nDisconnecting from robotic arms...")
-        # The API handles disconnection automatically
+        # The API handles disconnection automatically; cached sessions stay
+        # open so later controllers in this process can reuse them
 
 
 def main():
@@ -208,7 +262,7 @@ Examples:
             joint_angles = args.set
             # Convert from degrees to radians if needed
             if args.degrees:
-                joint_angles = [angle * 3.14159 / 180 for angle in joint_angles]
+                joint_angles = [angle * _DEG2RAD for angle in joint_angles]
             
             controller.set_joint_states(joint_angles, args.arm, speed=args.speed)
         
@@ -0,0 +1,60 @@
+"""TCP socket tuning for Realman arm connections."""
+
+import os
+import socket
+
+
+def enable_tcp_nodelay(ip: str, port: int) -> int:
+    """
+    Disable Nagle's algorithm on the sockets connected to an arm controller.
+
+    The Realman SDK opens its sockets inside the native library and does not
+    expose them, so the process's open file descriptors are scanned for TCP
+    sockets whose peer matches the arm's address. Every arm RPC is a small
+    request/response, which Nagle buffering can delay by tens of milliseconds.
+    Prints a warning when no socket was tuned.
+
+    Args:
+        ip: IP address or hostname of the arm controller
+        port: TCP port of the arm controller
+
+    Returns:
+        Number of sockets that had TCP_NODELAY enabled (0 where /proc is unavailable)
+    """
+    fd_dir = "/proc/self/fd"
+    if not os.path.isdir(fd_dir):
+        print(f"⚠ Cannot list sockets without /proc; TCP_NODELAY not set for {ip}:{port}")
+        return 0
+
+    # Peer addresses are numeric, so resolve a hostname before matching
+    try:
+        address = socket.gethostbyname(ip)
+    except OSError:
+        address = ip
+
+    tuned = 0
+    for name in os.listdir(fd_dir):
+        try:
+            fd = int(name)
+            if not os.readlink(os.path.join(fd_dir, name)).startswith("socket:"):
+                continue
+            # Work on a duplicate so closing it leaves the SDK's socket open
+            sock = socket.socket(fileno=os.dup(fd))
+        except (ValueError, OSError):
+            continue
+
+        try:
+            if sock.type != socket.SOCK_STREAM or sock.family not in (socket.AF_INET, socket.AF_INET6):
+                continue
+            peer = sock.getpeername()
+            if peer[0] == address and peer[1] == port:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                tuned += 1
+        except OSError:
+            pass
+        finally:
+            sock.close()
+
+    if tuned == 0:
+        print(f"⚠ No open socket to {ip}:{port} found; TCP_NODELAY not set")
+    return tuned
@@ -1,7 +1,14 @@
 """Dataset collection module for LeRobot v3 format."""
 
-from .lerobot_recorder import LeRobotRecorder
 from .episode import Episode
 
 __all__ = ["LeRobotRecorder", "Episode"]
 
+
+def __getattr__(name):
+    # The recorder needs the arm SDK and OpenCV; import it on first use, so
+    # convert_to_parquet runs on machines without them
+    if name == "LeRobotRecorder":
+        from .lerobot_recorder import LeRobotRecorder
+        return LeRobotRecorder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
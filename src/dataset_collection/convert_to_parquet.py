@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Repack Feather (Arrow IPC) episode files of a LeRobot v3 dataset as Parquet.
+
+Datasets recorded with --write-format feather keep the LeRobot directory
+layout, only the episode files are .feather. This converts them in place.
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.dataset_collection.parquet_options import PARQUET_CODECS, parquet_writer_options
+
+
+def convert_episode(feather_path: Path, compression: str = "zstd",
+                    compression_level: int = 1, keep: bool = False) -> Path:
+    """
+    Convert one Feather episode file to Parquet next to it.
+
+    Each IPC record batch becomes one Parquet row group, so the row group
+    size chosen at recording time is kept. The Parquet file is written under
+    a temporary name and renamed once complete.
+
+    Args:
+        feather_path: Path to episode_XXXXXX.feather
+        compression: Parquet codec, one of PARQUET_CODECS
+        compression_level: Codec level for zstd/gzip/brotli (ignored otherwise)
+        keep: Keep the Feather file after converting
+
+    Returns:
+        Path of the written Parquet file
+    """
+    parquet_path = feather_path.with_suffix(".parquet")
+    tmp_path = parquet_path.with_name(parquet_path.name + ".tmp")
+
+    with pa.memory_map(str(feather_path)) as source:
+        reader = pa.ipc.open_file(source)
+        with open(tmp_path, 'wb') as f:
+            with pq.ParquetWriter(f, reader.schema,
+                                  **parquet_writer_options(compression, compression_level)) as writer:
+                for i in range(reader.num_record_batches):
+                    writer.write_batch(reader.get_batch(i))
+            f.flush()
+            os.fsync(f.fileno())
+
+    os.replace(tmp_path, parquet_path)
+    if not keep:
+        feather_path.unlink()
+    return parquet_path
+
+
+def convert_dataset(dataset_path: Path, compression: str = "zstd",
+                    compression_level: int = 1, keep: bool = False) -> int:
+    """
+    Convert every Feather episode file of a dataset and update meta/info.json.
+
+    Args:
+        dataset_path: Dataset root (the directory containing meta/ and data/)
+        compression: Parquet codec, one of PARQUET_CODECS
+        compression_level: Codec level for zstd/gzip/brotli (ignored otherwise)
+        keep: Keep the Feather files after converting
+
+    Returns:
+        Number of converted episode files
+    """
+    episode_files = sorted((dataset_path / "data").glob("chunk-*/episode_*.feather"))
+    for feather_path in episode_files:
+        parquet_path = convert_episode(feather_path, compression, compression_level, keep)
+        print(f"✓ Converted {feather_path.name} -> {parquet_path}")
+
+    info_file = dataset_path / "meta" / "info.json"
+    if episode_files and info_file.exists():
+        with open(info_file) as f:
+            info = json.load(f)
+        options = parquet_writer_options(compression, compression_level)
+        info["write_format"] = "parquet"
+        info["compression"] = options["compression"]
+        info["compression_level"] = options["compression_level"]
+        with open(info_file, 'w') as f:
+            json.dump(info, f, indent=2)
+        print(f"✓ Updated dataset info: {info_file}")
+
+    return len(episode_files)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert Feather episode files of a LeRobot v3.0 dataset to Parquet"
+    )
+    parser.add_argument("dataset", type=str,
+                        help="Dataset directory (e.g. ./lerobot_data/my_dataset)")
+    parser.add_argument("--compression", type=str, choices=PARQUET_CODECS, default="zstd",
+                        help="Parquet compression codec (default: zstd)")
+    parser.add_argument("--compression-level", type=int, default=1,
+                        help="Compression level for zstd/gzip/brotli (default: 1)")
+    parser.add_argument("--keep", action="store_true",
+                        help="Keep the Feather files after converting")
+    args = parser.parse_args()
+
+    dataset_path = Path(args.dataset)
+    if not (dataset_path / "data").is_dir():
+        print(f"✗ No data directory in {dataset_path}")
+        return 1
+
+    converted = convert_dataset(dataset_path, args.compression, args.compression_level, args.keep)
+    if converted == 0:
+        print(f"⚠ No Feather episode files found in {dataset_path}")
+    else:
+        print(f"✓ Done ({converted} episodes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
     """Represents a single frame of data in an episode."""
     timestamp: float
@@ -36,7 +36,7 @@ class Frame:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     """
     Represents an episode in LeRobot v3 format.
@@ -55,16 +55,32 @@ class Episode:
     # Frames
     frames: List[Frame] = field(default_factory=list)
     
+    # Keep Frame objects in memory; False when frame data is streamed elsewhere
+    keep_frames: bool = True
+    
     # Episode-specific info
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Index assigned to the next added frame (independent of len(frames))
+    _next_index: int = field(default=0, init=False, repr=False)
+    
+    # Capture times of the first and last frame, for the duration
+    _first_timestamp: Optional[float] = field(default=None, init=False, repr=False)
+    _last_timestamp: Optional[float] = field(default=None, init=False, repr=False)
+    
     def __post_init__(self):
         """Initialize episode with start time."""
         if self.start_time is None:
             self.start_time = datetime.now().isoformat()
     
+    @property
+    def num_frames(self) -> int:
+        """Number of frames added to the episode."""
+        return self._next_index
+    
     def add_frame(self, observation: Dict[str, Any], action: Dict[str, Any], 
-                  state: Dict[str, Any], image_keys: Optional[List[str]] = None):
+                  state: Dict[str, Any], image_keys: Optional[List[str]] = None,
+                  timestamp: Optional[float] = None):
         """
         Add a frame to the episode.
         
@@ -73,10 +89,16 @@ class Episode:
             action: Action data (commanded positions, velocities, etc.)
             state: Robot state (current position, velocity, etc.)
             image_keys: List of image/camera names for this frame
+            timestamp: Capture time of the frame (default: current time)
         """
+        if timestamp is None:
+            timestamp = time.time()
+        index = self.mark_frame(timestamp)
+        if not self.keep_frames:
+            return
         frame = Frame(
-            timestamp=time.time(),
-            index=len(self.frames),
+            timestamp=timestamp,
+            index=index,
             observation=observation,
             action=action,
             state=state,
@@ -84,24 +106,41 @@ class Episode:
         )
         self.frames.append(frame)
     
+    def mark_frame(self, timestamp: Optional[float] = None) -> int:
+        """
+        Count a frame without storing its data (e.g. when it is streamed to disk).
+        
+        Args:
+            timestamp: Capture time of the frame (default: current time)
+            
+        Returns:
+            Index assigned to the frame
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+        self._last_timestamp = timestamp
+        index = self._next_index
+        self._next_index += 1
+        return index
+    
     def finalize(self):
         """Finalize the episode by setting end time and duration."""
         self.end_time = datetime.now().isoformat()
-        if self.frames:
-            start_timestamp = self.frames[0].timestamp
-            end_timestamp = self.frames[-1].timestamp
-            self.duration = end_timestamp - start_timestamp
+        if self._first_timestamp is not None:
+            self.duration = self._last_timestamp - self._first_timestamp
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the episode."""
         return {
             "episode_index": self.episode_index,
             "task": self.task,
-            "num_frames": len(self.frames),
+            "num_frames": self.num_frames,
             "duration": self.duration,
             "start_time": self.start_time,
             "end_time": self.end_time,
-            "fps": len(self.frames) / self.duration if self.duration > 0 else 0
+            "fps": self.num_frames / self.duration if self.duration > 0 else 0
         }
     
     def to_dict(self) -> Dict[str, Any]:
@@ -113,7 +152,7 @@ class Episode:
             "start_time": self.start_time,
             "end_time": self.end_time,
             "duration": self.duration,
-            "num_frames": len(self.frames),
+            "num_frames": self.num_frames,
             "metadata": self.metadata,
             "frames": [frame.to_dict() for frame in self.frames]
         }
@@ -2,19 +2,114 @@
 """
 LeRobot v3 Dataset Recorder for Realman Dual Arms
 Records data in LeRobot v3.0 format with Parquet files and video support.
+
+Joint angles, end effector poses and gripper positions are stored as float32.
+That keeps about 7 significant digits (~1e-7 rad on joint angles,
+sub-micrometre on positions, exact for the integer gripper range), well below
+the arms' encoder resolution, at half the size of float64.
+Timestamps stay float64, since float32 cannot resolve milliseconds in epoch time.
 """
 
+import gc
 import json
+import os
 import time
 import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any, List, Optional, Union
 import numpy as np
 import cv2
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 from Robotic_Arm.rm_robot_interface import *
+from ..arm_control.tcp import enable_tcp_nodelay
 from .episode import Episode, Frame
+from .parquet_options import (
+    FEATHER_CODECS, INDEX_COLUMNS, LEVELED_CODECS, PARQUET_CODECS, WRITE_FORMATS,
+    parquet_writer_options,
+)
+from .video import CameraVideoWriter
+
+_DEG2RAD = np.float32(np.pi / 180.0)
+_ZERO_GRIPPER = np.float32(0.0)
+
+# Shared, read-only fallbacks for a missing or malformed end effector pose
+_ZERO_XYZ = np.zeros(3, dtype=np.float32)
+_ZERO_XYZ.setflags(write=False)
+_ZERO_RPY = np.zeros(3, dtype=np.float32)
+_ZERO_RPY.setflags(write=False)
+
+# Size of the write buffer in front of episode data files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Default row group length in seconds of recording. Frames are buffered in
+# memory until their row group is flushed, so this is also the most that is
+# lost if the recorder crashes.
+_ROW_GROUP_SECONDS = 10
+
+# Below this frame size (pixels), OpenCV's internal thread pool costs more in
+# dispatch than it saves on frame conversion in retrieve(), so it is disabled
+_CV_PARALLEL_MIN_PIXELS = 1_000_000
+
+# Per-arm column names, built once instead of per frame:
+# (arm qpos, eef position, eef euler, gripper, action qpos, action gripper, state qpos)
+_ARM_COLUMNS = {
+    side: (
+        f"observation.state.{side}_arm",
+        f"observation.state.{side}_eef_pos",
+        f"observation.state.{side}_eef_euler",
+        f"observation.state.{side}_gripper",
+        f"action.{side}_arm",
+        f"action.{side}_gripper",
+        f"state.{side}_arm",
+    )
+    for side in ("left", "right")
+}
+
+# Per-arm row validity, kept next to the columns in the row buffers but not
+# written as a column: rows where the arm read failed are stored as nulls
+_ARM_VALID = {side: f"_valid.{side}" for side in ("left", "right")}
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize NumPy values that the stdlib JSON encoder does not handle."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# json.dumps() builds a new encoder whenever options are passed; build it once
+_JSON_ENCODER = json.JSONEncoder(default=_json_default)
+
+
+def _dumps_line(obj: Dict[str, Any]) -> bytes:
+    """Encode an object as one newline-terminated JSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return (_JSON_ENCODER.encode(obj) + "\n").encode("utf-8")
+
+
+def _dump_json(obj: Dict[str, Any], fp):
+    """Write an object as an indented JSON document to a binary file, using orjson when available."""
+    if orjson is not None:
+        fp.write(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    else:
+        fp.write(json.dumps(obj, indent=2, default=_json_default).encode("utf-8"))
 
 
 class LeRobotRecorder:
@@ -28,7 +123,7 @@ class LeRobotRecorder:
     │   └── episodes.jsonl           # Episode metadata (one JSON per line)
     ├── data/
     │   └── chunk-000/
-    │       └── episode_000000.parquet  # Episode data
+    │       └── episode_000000.parquet  # Episode data (.feather with write_format="feather")
     └── videos/
         └── chunk-000/
             ├── episode_000000_observation.image.mp4
@@ -44,7 +139,13 @@ class LeRobotRecorder:
                  arm1_port: int = 8080,
                  arm2_ip: str = "169.254.128.19",
                  arm2_port: int = 8080,
-                 cameras: Optional[List[Union[str, int]]] = None):
+                 cameras: Optional[List[Union[str, int]]] = None,
+                 realtime: bool = False,
+                 realtime_cpu: Optional[int] = None,
+                 row_group_size: Optional[int] = None,
+                 compression: str = "zstd",
+                 compression_level: Optional[int] = 1,
+                 write_format: str = "parquet"):
         """
         Initialize the LeRobot recorder.
         
@@ -58,12 +159,61 @@ class LeRobotRecorder:
             arm2_ip: IP address of right arm
             arm2_port: Port of right arm
             cameras: List of camera sources (e.g., ["/dev/video0", "/dev/video2"] or [0, 1])
+            realtime: Pin the recording thread to a CPU and run it under SCHED_FIFO (Linux)
+            realtime_cpu: CPU for the realtime recording thread (default: the
+                highest-numbered CPU available). Arm I/O, Parquet writer and
+                video encoder threads are kept on the other CPUs.
+            row_group_size: Frames per Parquet row group (default: about
+                10 s of frames at fps). Each row group is buffered in memory and
+                written in one flush, so a crash loses up to one row group of
+                frames; smaller values lower memory use and that loss window,
+                larger values read faster.
+            compression: Parquet codec, one of PARQUET_CODECS. Zstd level 1
+                compresses about as well as Snappy at a lower write cost;
+                "none" writes fastest at the cost of larger files.
+            compression_level: Codec level for zstd/gzip/brotli (ignored otherwise)
+            write_format: Episode file format, one of WRITE_FORMATS. "feather"
+                streams Arrow IPC files (zstd, lz4 or no compression), which
+                are cheaper to write; convert them with convert_to_parquet.
         """
+        if row_group_size is None:
+            row_group_size = max(1, round(fps * _ROW_GROUP_SECONDS))
+        if row_group_size < 1:
+            raise ValueError(f"row_group_size must be positive, got {row_group_size}")
+        if compression not in PARQUET_CODECS:
+            raise ValueError(f"compression must be one of {PARQUET_CODECS}, got {compression!r}")
+        if write_format not in WRITE_FORMATS:
+            raise ValueError(f"write_format must be one of {WRITE_FORMATS}, got {write_format!r}")
+        if write_format == "feather" and compression not in FEATHER_CODECS:
+            raise ValueError(f"feather compression must be one of {FEATHER_CODECS}, got {compression!r}")
+        if compression not in LEVELED_CODECS:
+            compression_level = None
+        
+        # Pick the episode writer once, so a missing pyarrow shows up before recording
+        if HAS_PYARROW:
+            self._save_fn = self._save_episode_parquet
+        else:
+            print(f"Warning: pyarrow required for {write_format.capitalize()} export, episodes will be saved as JSON.")
+            print("Install with: pip install pyarrow")
+            self._save_fn = self._save_episode_json
+        
         self.dataset_name = dataset_name
         self.dataset_path = Path(dataset_path) / dataset_name
         self.robot_type = robot_type
         self.fps = fps
         self.interval = 1.0 / fps
+        self.realtime = realtime
+        # In realtime mode the recording thread gets one CPU; worker threads share the rest
+        self._worker_cpus: Optional[set] = None
+        if realtime and hasattr(os, "sched_getaffinity"):
+            allowed = os.sched_getaffinity(0)
+            if realtime_cpu is None:
+                realtime_cpu = max(allowed)
+            if len(allowed) > 1:
+                self._worker_cpus = allowed - {realtime_cpu}
+        self.realtime_cpu = realtime_cpu
+        # Niceness of the creating thread, restored on worker threads (realtime mode)
+        self._base_nice = os.getpriority(os.PRIO_PROCESS, 0) if hasattr(os, "getpriority") else 0
         
         # Arm connection info
         self.arm1_ip = arm1_ip
@@ -78,16 +228,61 @@ class LeRobotRecorder:
         self.arm1 = None
         self.arm2 = None
         
+        # Persistent worker pools for blocking arm RPCs: arm reads run on
+        # _io_pool and wait on their gripper RPC, which runs on its own pool.
+        # Gripper RPCs never wait on anything, so overlapping reads (more
+        # arms, or read_arm_observations_parallel during recording) queue
+        # instead of taking every worker and starving their gripper RPCs.
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="arm_io", initializer=self._init_arm_worker
+        )
+        self._gripper_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="gripper_io", initializer=self._init_arm_worker
+        )
+        self._arm_readers = []  # (arm_name, bound reader) for connected arms, set in connect()
+        self._arm_dof: Dict[str, int] = {}  # Joint count per connected arm, read in connect()
+        self._qpos_bufs: Dict[str, np.ndarray] = {}  # Per-arm joint buffers reused by every read
+        self._pose_bufs: Dict[str, np.ndarray] = {}  # Per-arm [x, y, z, rx, ry, rz] buffers, likewise
+        self._arm_obs: Dict[str, Dict[str, Any]] = {}  # Per-arm observation dicts reused by every read
+        
         # Camera support
         self.cameras = cameras or []
         self.cv2_caps = {}  # Camera captures: {camera_name: cv2.VideoCapture}
         self.camera_names = {}  # Map camera index/source to readable name
+        self._video_writers: Dict[str, CameraVideoWriter] = {}  # Per-camera MP4 for the current episode
         
         # Recording state
-        self.recording = False
+        self._stop = threading.Event()  # Set while not recording; also wakes the pacing sleep
+        self._stop.set()
+        self._stats_frames = 0  # Frames recorded since start_recording(), read by the status thread
+        self._stats_start = 0  # Monotonic start time of the current recording, in ns
+        # Wall-clock epoch minus monotonic time, re-anchored by start_recording();
+        # frame timestamps are monotonic + offset so clock adjustments cannot make them jump
+        self._clock_offset = time.time() - time.monotonic()
+        self._max_frames: Optional[int] = None  # Frame limit for fixed-length episodes
+        self._gc_paused = False  # Garbage collector frozen and disabled by start_recording() (realtime)
         self.current_episode: Optional[Episode] = None
         self.episodes: List[Episode] = []
         
+        # Incremental Parquet output for the current episode
+        self._pq_writer = None
+        self._pq_file = None  # Buffered file handle underneath the writer
+        self.row_group_size = row_group_size
+        self._pq_schema = None  # Arrow schema, built with the column buffers
+        self.compression = compression
+        self.compression_level = compression_level
+        self.write_format = write_format
+        self._pq_columns: Optional[List[str]] = None  # Data columns, fixed by the connected arms
+        self._pq_validity: Dict[str, str] = {}  # Arm data column -> its arm's validity array
+        self._pq_buffer: Dict[str, np.ndarray] = {}  # Preallocated column arrays, one row per frame
+        self._pq_spare: Dict[str, np.ndarray] = {}  # Second set of columns, filled while one is written
+        self._pq_rows = 0  # Rows of _pq_buffer filled since the last flush
+        # Row groups are encoded and written off the recording thread
+        self._pq_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="parquet", initializer=self._pin_worker_thread
+        )
+        self._pq_pending: Optional[Future] = None
+        
         # Dataset metadata
         self.dataset_metadata = {
             "name": dataset_name,
@@ -95,7 +290,11 @@ class LeRobotRecorder:
             "fps": fps,
             "created_at": datetime.now().isoformat(),
             "version": "3.0",
-            "codebase_version": "0.1.0"
+            "codebase_version": "0.1.0",
+            "row_group_size": row_group_size,
+            "compression": compression,
+            "compression_level": compression_level,
+            "write_format": write_format
         }
         
         # Create directory structure
@@ -107,6 +306,9 @@ class LeRobotRecorder:
         (self.dataset_path / "meta").mkdir(exist_ok=True)
         (self.dataset_path / "data" / "chunk-000").mkdir(parents=True, exist_ok=True)
         (self.dataset_path / "videos" / "chunk-000").mkdir(parents=True, exist_ok=True)
+        
+        # Episode metadata is appended through one handle for the whole session
+        self._episodes_jsonl = open(self.dataset_path / "meta" / "episodes.jsonl", 'ab')
     
     def connect(self) -> bool:
         """Connect to the robotic arms."""
@@ -118,6 +320,7 @@ class LeRobotRecorder:
             self.robot_left = RoboticArm(rm_thread_mode_e.RM_TRIPLE_MODE_E)
             self.arm1 = self.robot_left.rm_create_robot_arm(self.arm1_ip, self.arm1_port)
             if self.arm1 and self.arm1.id != -1:
+                enable_tcp_nodelay(self.arm1_ip, self.arm1_port)
                 print(f"✓ Connected to Left Arm (ID: {self.arm1.id})")
             else:
                 print("✗ Failed to connect to Left Arm")
@@ -128,6 +331,7 @@ class LeRobotRecorder:
             self.robot_right = RoboticArm(rm_thread_mode_e.RM_TRIPLE_MODE_E)
             self.arm2 = self.robot_right.rm_create_robot_arm(self.arm2_ip, self.arm2_port)
             if self.arm2 and self.arm2.id != -1:
+                enable_tcp_nodelay(self.arm2_ip, self.arm2_port)
                 print(f"✓ Connected to Right Arm (ID: {self.arm2.id})")
             else:
                 print("✗ Failed to connect to Right Arm")
@@ -136,6 +340,23 @@ class LeRobotRecorder:
         # Keep self.robot for backward compatibility (use robot_left if available)
         self.robot = self.robot_left if self.robot_left else self.robot_right
         
+        # Bind the per-arm readers once instead of on every frame
+        self._arm_readers = []
+        if self.arm1:
+            self._arm_readers.append(("left", partial(self.read_arm_observation, "left")))
+        if self.arm2:
+            self._arm_readers.append(("right", partial(self.read_arm_observation, "right")))
+        
+        # Read each arm once to verify it and fix the joint columns' width
+        self._arm_dof = {}
+        for arm_name, reader in self._arm_readers:
+            arm_obs = reader()
+            if arm_obs is None:
+                print(f"✗ Connected to {arm_name.capitalize()} Arm but cannot read its state")
+                return False
+            self._arm_dof[arm_name] = len(arm_obs["qpos"])
+        self._allocate_row_buffer()
+        
         # Connect cameras
         if self.cameras:
             if not self.connect_cameras():
@@ -149,6 +370,7 @@ class LeRobotRecorder:
             return True
         
         print(f"\nConnecting to {len(self.cameras)} camera(s)...")
+        self.dataset_metadata["cameras"] = {}
         all_connected = True
         
         for idx, camera_source in enumerate(self.cameras):
@@ -188,134 +410,159 @@ class LeRobotRecorder:
                 height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
                 fps_actual = cap.get(cv2.CAP_PROP_FPS)
                 print(f"  ✓ Connected to {camera_name}: {width}x{height} @ {fps_actual:.1f} FPS")
+                # Frames are encoded in OpenCV's native channel order, with no
+                # per-frame BGR->RGB conversion; readers convert if they need RGB
+                self.dataset_metadata["cameras"][camera_name] = {
+                    "height": frame.shape[0],
+                    "width": frame.shape[1],
+                    "color_order": "BGR"
+                }
             
             except Exception as e:
                 print(f"  ✗ Error connecting to camera {camera_display}: {e}")
                 all_connected = False
         
+        # Frame conversion runs on the recording thread; keep it single-threaded
+        # for small frames (its worker threads would also inherit the realtime CPU pin)
+        cameras = self.dataset_metadata["cameras"].values()
+        if cameras and max(c["width"] * c["height"] for c in cameras) < _CV_PARALLEL_MIN_PIXELS:
+            cv2.setNumThreads(1)
+        
         return all_connected
     
     def read_camera_frames(self) -> Dict[str, np.ndarray]:
         """
         Read frames from all connected cameras.
         
+        All cameras grab first, so their exposures are taken close together
+        and the waits for the next frame overlap; decoding (retrieve) follows
+        afterwards.
+        
         Returns:
             Dictionary mapping camera names to frame arrays (BGR format)
         """
         frames = {}
+        grabbed = {}
         
         for camera_name, cap in self.cv2_caps.items():
             try:
-                ret, frame = cap.read()
-                if ret and frame is not None:
-                    frames[camera_name] = frame
-                else:
-                    # Frame read failed, store None to indicate error
-                    frames[camera_name] = None
+                grabbed[camera_name] = cap.grab()
+            except Exception as e:
+                print(f"Warning: Error reading from {camera_name}: {e}")
+                grabbed[camera_name] = False
+        
+        for camera_name, cap in self.cv2_caps.items():
+            if not grabbed[camera_name]:
+                # Frame read failed, store None to indicate error
+                frames[camera_name] = None
+                continue
+            try:
+                ret, frame = cap.retrieve()
+                frames[camera_name] = frame if ret else None
             except Exception as e:
                 print(f"Warning: Error reading from {camera_name}: {e}")
                 frames[camera_name] = None
         
         return frames
     
-    def read_arm_observation(self, arm_name: str) -> Dict[str, Any]:
+    def read_arm_observation(self, arm_name: str, timestamp: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Read observation data from an arm.
         Uses dedicated robot instance for each arm for parallel execution.
         
+        A failed state RPC (non-zero SDK return code, or a state without
+        joint positions) is treated as transient: the frame is recorded
+        without this arm. Exceptions raised by the SDK are not caught here
+        and end the recording (see recording_loop).
+        
         Args:
             arm_name: "left" or "right"
+            timestamp: Frame timestamp to store (default: current time)
             
         Returns:
-            Dictionary containing observation data
+            Dictionary with "qpos", "position", "orientation" and
+            "gripper_position" always set, or None if the arm state could not
+            be read. The dictionary and its arrays belong to the arm and are
+            overwritten by its next read; copy them to keep them.
         """
-        observation = {
-            "timestamp": time.time(),
-            "arm": arm_name
-        }
+        # Select the correct robot instance for this arm
+        if arm_name == "left" and self.robot_left:
+            robot = self.robot_left
+        elif arm_name == "right" and self.robot_right:
+            robot = self.robot_right
+        else:
+            robot = self.robot
         
-        try:
-            # Select the correct robot instance for this arm
-            if arm_name == "left" and self.robot_left:
-                robot = self.robot_left
-            elif arm_name == "right" and self.robot_right:
-                robot = self.robot_right
-            else:
-                robot = self.robot
-            
-            # Get current arm state
-            result = robot.rm_get_current_arm_state()
-            if result[0] == 0:
-                arm_state = result[1]
-                
-                # Joint positions (state.qpos)
-                joint_angles_rad = [angle * np.pi / 180 for angle in arm_state.get("joint", [])]
-                observation["qpos"] = joint_angles_rad
-                
-                # End effector pose
-                # Note: pose is a flat list [x, y, z, rx, ry, rz] from rm_current_arm_state_t.to_dictionary()
-                pose_list = arm_state.get("pose", [0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
-                
-                # Ensure we have 6 elements
-                if len(pose_list) >= 6:
-                    observation["position"] = pose_list[0:3]  # [x, y, z] in meters
-                    observation["orientation"] = pose_list[3:6]  # [rx, ry, rz] in radians
-                else:
-                    # Fallback if pose format is unexpected
-                    observation["position"] = [0.0, 0.0, 0.0]
-                    observation["orientation"] = [0.0, 0.0, 0.0]
-            
-            # Get gripper state
-            gripper_result = robot.rm_get_gripper_state()
-            if gripper_result[0] == 0:
-                gripper_data = gripper_result[1]
-                observation["gripper_position"] = gripper_data.get("position", 0.0)
-            else:
-                observation["gripper_position"] = 0.0
-                
-        except Exception as e:
-            observation["error"] = str(e)
+        # Issue the gripper RPC concurrently with the arm state RPC
+        gripper_future = self._gripper_pool.submit(robot.rm_get_gripper_state)
         
-        return observation
-    
-    def read_arm_observations_parallel(self) -> Dict[str, Dict[str, Any]]:
-        """
-        Read observations from both arms in parallel using threading.
+        # Get current arm state
+        result = robot.rm_get_current_arm_state()
+        gripper_result = gripper_future.result()
+        code, arm_state = result
+        if code != 0 or "joint" not in arm_state:
+            return None
         
-        Returns:
-            Dictionary with "left" and "right" arm observations
-        """
-        observations = {}
-        errors = {}
+        observation = self._arm_obs.get(arm_name)
+        if observation is None:
+            observation = self._arm_obs[arm_name] = {"arm": arm_name}
+        observation["timestamp"] = time.time() if timestamp is None else timestamp
         
-        def read_arm(arm_name):
-            """Read arm data and store in shared dict."""
-            try:
-                obs = self.read_arm_observation(arm_name)
-                observations[arm_name] = obs
-            except Exception as e:
-                errors[arm_name] = str(e)
+        # Joint positions (state.qpos)
+        # SDK reports degrees; fill the arm's float32 buffer and convert in place
+        joints = arm_state["joint"]
+        qpos = self._qpos_bufs.get(arm_name)
+        if qpos is None or len(qpos) != len(joints):
+            qpos = self._qpos_bufs[arm_name] = np.empty(len(joints), dtype=np.float32)
+        qpos[:] = joints
+        np.multiply(qpos, _DEG2RAD, out=qpos)
+        observation["qpos"] = qpos
         
-        # Create threads for each arm
-        threads = []
-        if self.arm1:
-            threads.append(threading.Thread(target=read_arm, args=("left",)))
-        if self.arm2:
-            threads.append(threading.Thread(target=read_arm, args=("right",)))
+        # End effector pose
+        # Note: pose is a flat list [x, y, z, rx, ry, rz] from rm_current_arm_state_t.to_dictionary()
+        pose_list = arm_state["pose"] if "pose" in arm_state else ()
         
-        # Start all threads
-        for thread in threads:
-            thread.start()
+        # Ensure we have 6 elements
+        if len(pose_list) >= 6:
+            # Orientation is already in radians, so only the joints need converting
+            pose = self._pose_bufs.get(arm_name)
+            if pose is None:
+                pose = self._pose_bufs[arm_name] = np.empty(6, dtype=np.float32)
+            pose[:] = pose_list[:6]
+            observation["position"] = pose[0:3]  # [x, y, z] in meters (view)
+            observation["orientation"] = pose[3:6]  # [rx, ry, rz] in radians (view)
+        else:
+            # Fallback if pose format is unexpected
+            observation["position"] = _ZERO_XYZ
+            observation["orientation"] = _ZERO_RPY
         
-        # Wait for all to complete
-        for thread in threads:
-            thread.join()
+        # Get gripper state
+        gripper_code, gripper_data = gripper_result
+        if gripper_code == 0 and "position" in gripper_data:
+            observation["gripper_position"] = np.float32(gripper_data["position"])
+        else:
+            observation["gripper_position"] = _ZERO_GRIPPER
         
-        # Report any errors
-        if errors:
-            print(f"Warning: Errors reading arms: {errors}")
+        return observation
+    
+    def _submit_arm_reads(self, timestamp: Optional[float] = None) -> Dict[str, Future]:
+        """Submit observation reads for all connected arms to the I/O worker pool."""
+        submit = self._io_pool.submit
+        return {arm_name: submit(reader, timestamp) for arm_name, reader in self._arm_readers}
+    
+    def _collect_arm_reads(self, futures: Dict[str, Future]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Wait for submitted arm reads and gather their observations."""
+        return {arm_name: future.result() for arm_name, future in futures.items()}
+    
+    def read_arm_observations_parallel(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Read observations from both arms in parallel on the I/O worker pool.
         
-        return observations
+        Returns:
+            Dictionary with "left" and "right" arm observations (None for an
+            arm whose state could not be read)
+        """
+        return self._collect_arm_reads(self._submit_arm_reads())
     
     def start_episode(self, task: str, task_index: int = 0) -> Episode:
         """
@@ -332,8 +579,24 @@ class LeRobotRecorder:
         self.current_episode = Episode(
             episode_index=episode_index,
             task=task,
-            task_index=task_index
+            task_index=task_index,
+            # Frame data lives in the column buffers, not in Frame objects
+            keep_frames=False
         )
+        self._pq_writer = None
+        cameras = self.dataset_metadata.get("cameras", {})
+        self._video_writers = {
+            camera_name: CameraVideoWriter(
+                self._episode_video_path(self.current_episode, camera_name), self.fps,
+                cpus=self._worker_cpus,
+                frame_size=(cameras[camera_name]["width"], cameras[camera_name]["height"])
+                if camera_name in cameras else None
+            )
+            for camera_name in self.cv2_caps
+        }
+        if self._pq_columns is None:
+            self._allocate_row_buffer()
+        self._pq_rows = 0
         
         print(f"\n{'='*60}")
         print(f"Started Episode {episode_index}: {task}")
@@ -346,106 +609,241 @@ class LeRobotRecorder:
         if not self.current_episode:
             raise RuntimeError("No active episode. Call start_episode() first.")
         
-        # Read observations from both arms in parallel
-        observation = {}
-        action = {}
-        state = {}
+        # One timestamp shared by the frame and all of its arm observations
+        timestamp = time.monotonic() + self._clock_offset
         
-        # Use parallel reading when both arms are present
-        if self.arm1 and self.arm2:
-            arm_observations = self.read_arm_observations_parallel()
-            left_obs = arm_observations.get("left", {})
-            right_obs = arm_observations.get("right", {})
-        else:
-            # Single arm or fallback to sequential
-            arm_observations = {}
-            if self.arm1:
-                left_obs = self.read_arm_observation("left")
-            else:
-                left_obs = {}
-            if self.arm2:
-                right_obs = self.read_arm_observation("right")
-            else:
-                right_obs = {}
-        
-        # Extract data from observations
-        if "qpos" in left_obs:
-            observation["observation.state.left_arm"] = left_obs.get("qpos", [])
-            observation["observation.state.left_eef_pos"] = left_obs.get("position", [])
-            observation["observation.state.left_eef_euler"] = left_obs.get("orientation", [])
-            observation["observation.state.left_gripper"] = left_obs.get("gripper_position", 0.0)
-            
-            action["action.left_arm"] = left_obs.get("qpos", [])
-            action["action.left_gripper"] = left_obs.get("gripper_position", 0.0)
-            
-            state["state.left_arm"] = left_obs.get("qpos", [])
+        # Start the arm RPCs, then capture camera frames while they are in flight
+        arm_futures = self._submit_arm_reads(timestamp)
+        camera_frames = self.read_camera_frames()
         
-        if "qpos" in right_obs:
-            observation["observation.state.right_arm"] = right_obs.get("qpos", [])
-            observation["observation.state.right_eef_pos"] = right_obs.get("position", [])
-            observation["observation.state.right_eef_euler"] = right_obs.get("orientation", [])
-            observation["observation.state.right_gripper"] = right_obs.get("gripper_position", 0.0)
-            
-            action["action.right_arm"] = right_obs.get("qpos", [])
-            action["action.right_gripper"] = right_obs.get("gripper_position", 0.0)
+        # Parquet row for this frame, written straight into the column buffers
+        episode = self.current_episode
+        buffer = self._pq_buffer
+        row = self._pq_rows
+        buffer["episode_index"][row] = episode.episode_index
+        buffer["frame_index"][row] = episode.num_frames
+        buffer["timestamp"][row] = timestamp
+        
+        # Store each arm's observation as soon as its read completes
+        for arm_name, future in arm_futures.items():
+            arm_obs = future.result()
+            arm_columns = _ARM_COLUMNS[arm_name]
+            if arm_obs is None:
+                # Transient arm read failure, keep the frame with this arm null
+                buffer[_ARM_VALID[arm_name]][row] = False
+                for key in arm_columns:
+                    buffer[key][row] = 0
+                continue
+            buffer[_ARM_VALID[arm_name]][row] = True
+            (k_qpos, k_pos, k_euler, k_gripper,
+             k_action_qpos, k_action_gripper, k_state_qpos) = arm_columns
+            # read_arm_observation always fills these keys (with zero fallbacks)
+            qpos = arm_obs["qpos"]
+            gripper = arm_obs["gripper_position"]
             
-            state["state.right_arm"] = right_obs.get("qpos", [])
+            buffer[k_qpos][row] = qpos
+            buffer[k_pos][row] = arm_obs["position"]
+            buffer[k_euler][row] = arm_obs["orientation"]
+            buffer[k_gripper][row] = gripper
+            buffer[k_action_qpos][row] = qpos
+            buffer[k_action_gripper][row] = gripper
+            buffer[k_state_qpos][row] = qpos
         
-        # Read camera frames
-        camera_frames = self.read_camera_frames()
-        image_keys = []
+        # Camera frames go to the per-camera MP4 encoders
         for camera_name, frame in camera_frames.items():
-            if frame is not None:
-                # Add image to observation with LeRobot naming convention
-                image_key = f"observation.{camera_name}"
-                observation[image_key] = frame
-                image_keys.append(image_key)
-        
-        # Add frame to episode
-        self.current_episode.add_frame(
-            observation=observation,
-            action=action,
-            state=state,
-            image_keys=image_keys
-        )
+            self._video_writers[camera_name].write(frame)
+        
+        episode.mark_frame(timestamp)
+        
+        # Stream full row groups to disk instead of holding them until the end
+        self._pq_rows = row + 1
+        if self._pq_rows >= len(buffer["frame_index"]):
+            if HAS_PYARROW:
+                self._flush_episode_rows(episode)
+            else:
+                # The JSON fallback writes the whole episode at the end
+                self._grow_row_buffer()
+    
+    def _apply_realtime_priority(self):
+        """
+        Pin the calling thread to one CPU and raise it to SCHED_FIFO.
+        
+        Linux only. SCHED_FIFO needs CAP_SYS_NICE or a realtime rlimit
+        (`ulimit -r`); without it, fall back to a lower nice value.
+        """
+        if not hasattr(os, "sched_setscheduler"):
+            print("⚠ Warning: Realtime scheduling is not supported on this platform")
+            return
+        
+        # Pid 0 refers to the calling thread on Linux
+        try:
+            os.sched_setaffinity(0, {self.realtime_cpu})
+            print(f"✓ Recording thread pinned to CPU {self.realtime_cpu}")
+        except OSError as e:
+            print(f"⚠ Warning: Could not set CPU affinity: {e}")
+        
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+            print("✓ Recording thread running with SCHED_FIFO priority 50")
+        except PermissionError:
+            try:
+                os.nice(-10)
+                print("⚠ SCHED_FIFO not permitted, recording thread niceness lowered by 10 instead")
+            except OSError:
+                print("⚠ Warning: No permission to raise recording thread priority")
+    
+    def _pin_worker_thread(self):
+        """
+        Run a worker thread at normal priority, off the recording thread's CPU.
+        
+        Realtime mode only. Pool threads are started lazily by their first
+        submit, which comes from the recording thread, so they would
+        otherwise inherit its SCHED_FIFO priority (or lowered niceness) and
+        preempt the arm I/O workers.
+        """
+        if not self.realtime:
+            return
+        if hasattr(os, "sched_setscheduler"):
+            try:
+                os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+                os.setpriority(os.PRIO_PROCESS, 0, self._base_nice)
+            except OSError as e:
+                print(f"⚠ Warning: Could not reset worker thread priority: {e}")
+        if not self._worker_cpus:
+            return
+        try:
+            os.sched_setaffinity(0, self._worker_cpus)
+        except OSError as e:
+            print(f"⚠ Warning: Could not set worker thread CPU affinity: {e}")
+    
+    def _init_arm_worker(self):
+        """
+        Set up an arm I/O worker thread in realtime mode.
+        
+        The recording thread waits on these RPCs every frame, so they run
+        just below it (SCHED_FIFO 49) when permitted. Failures are silent;
+        the recording thread already reports missing permissions.
+        """
+        if not self.realtime:
+            return
+        self._pin_worker_thread()
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(49))
+        except (AttributeError, OSError):
+            pass
+    
+    @property
+    def recording(self) -> bool:
+        """Whether a recording is in progress."""
+        return not self._stop.is_set()
     
     def recording_loop(self):
-        """Main recording loop running at specified FPS."""
+        """
+        Main recording loop running at specified FPS.
+        
+        Frames are paced against a fixed grid of monotonic deadlines so that
+        jitter in individual frames does not accumulate into drift. If a frame
+        overruns its slot, the grid is resynchronized to the current time.
+        """
+        if self.realtime:
+            self._apply_realtime_priority()
+        
+        # Hoist per-frame lookups out of the loop
+        monotonic_ns = time.monotonic_ns
+        stop = self._stop
+        record_frame = self.record_frame
+        interval_ns = round(1e9 / self.fps)  # Integer ns grid avoids float accumulation error
+        max_frames = self._max_frames
+        
         frame_count = 0
-        start_time = time.time()
+        next_deadline = monotonic_ns()
         
-        while self.recording:
-            loop_start = time.time()
-            
-            try:
-                self.record_frame()
+        # Transient arm read failures are handled inside record_frame; anything
+        # that reaches here is unexpected and ends the recording
+        try:
+            while not stop.is_set():
+                record_frame()
                 frame_count += 1
+                # Status output is left to _status_loop to keep this thread I/O free
+                self._stats_frames = frame_count
                 
-                # Print status every second
-                if frame_count % self.fps == 0:
-                    elapsed = time.time() - start_time
-                    actual_fps = frame_count / elapsed if elapsed > 0 else 0
-                    print(f"Recording... {elapsed:.1f}s | {frame_count} frames | {actual_fps:.1f} FPS")
-            
-            except Exception as e:
-                print(f"Error recording frame: {e}")
-            
-            # Sleep to maintain FPS
-            elapsed_frame = time.time() - loop_start
-            sleep_time = max(0, self.interval - elapsed_frame)
-            time.sleep(sleep_time)
-    
-    def start_recording(self):
-        """Start recording in a separate thread."""
-        self.recording = True
+                if max_frames is not None and frame_count >= max_frames:
+                    # Fixed-length episode is complete
+                    break
+                
+                # Sleep until the next deadline to maintain FPS, reading the clock
+                # once per frame and reusing it for the resync
+                next_deadline += interval_ns
+                now = monotonic_ns()
+                sleep_ns = next_deadline - now
+                if sleep_ns > 0:
+                    # Returns early when stop_recording() is called
+                    stop.wait(sleep_ns / 1e9)
+                else:
+                    # Overran the frame slot, resync instead of bursting to catch up
+                    next_deadline = now
+        except Exception as e:
+            print(f"✗ Recording stopped after {frame_count} frames: {e}")
+            traceback.print_exc()
+        finally:
+            stop.set()
+    
+    def _status_loop(self):
+        """Print recording progress once per second, off the recording thread."""
+        while not self._stop.wait(1.0):
+            frame_count = self._stats_frames
+            elapsed = (time.monotonic_ns() - self._stats_start) / 1e9
+            actual_fps = frame_count / elapsed if elapsed > 0 else 0
+            print(f"Recording... {elapsed:.1f}s | {frame_count} frames | {actual_fps:.1f} FPS")
+    
+    def start_recording(self, duration: Optional[float] = None):
+        """
+        Start recording in a separate thread.
+        
+        Args:
+            duration: Stop automatically after this many seconds worth of
+                frames (fps * duration). None records until stop_recording().
+        """
+        self._max_frames = None if duration is None else max(1, round(duration * self.fps))
+        self._stats_frames = 0
+        self._stats_start = time.monotonic_ns()
+        self._clock_offset = time.time() - time.monotonic()
+        if self.realtime and not self._gc_paused:
+            # No collector pauses while recording; the frame path allocates few
+            # cyclic objects. Collect first so only live objects are frozen,
+            # which keeps them out of any scan until the episode ends.
+            gc.collect()
+            gc.freeze()
+            gc.disable()
+            self._gc_paused = True
+        self._stop.clear()
         self.recording_thread = threading.Thread(target=self.recording_loop, daemon=True)
         self.recording_thread.start()
+        self.status_thread = threading.Thread(target=self._status_loop, daemon=True)
+        self.status_thread.start()
     
     def stop_recording(self):
-        """Stop recording."""
-        self.recording = False
+        """
+        Stop recording.
+        
+        Waits for the recording thread to finish its current frame, however
+        long a stalled arm RPC takes: the row buffers are flushed and swapped
+        in end_episode, which must not happen while the thread writes them.
+        """
+        self._stop.set()
         if hasattr(self, 'recording_thread'):
             self.recording_thread.join(timeout=2.0)
+            if self.recording_thread.is_alive():
+                print("⚠ Recording thread is still finishing a frame (arm RPC stalled?), waiting...")
+                self.recording_thread.join()
+        if hasattr(self, 'status_thread'):
+            self.status_thread.join(timeout=2.0)
+        if self._gc_paused:
+            # Return the frozen objects to the collector and free the episode's garbage
+            gc.unfreeze()
+            gc.enable()
+            gc.collect()
+            self._gc_paused = False
     
     def end_episode(self):
         """End the current episode and save it."""
@@ -467,104 +865,263 @@ class LeRobotRecorder:
         print(f"{'='*60}\n")
         
         # Save episode data
-        self._save_episode(self.current_episode)
+        self._close_videos()
+        self._save_fn(self.current_episode)
+        # Keep info.json current, so an interrupted session still describes its episodes
+        self._write_dataset_info()
         
         self.current_episode = None
     
-    def _save_episode(self, episode: Episode):
-        """Save episode data in LeRobot v3 format."""
-        try:
-            import pandas as pd
-            import pyarrow as pa
-            import pyarrow.parquet as pq
-        except ImportError:
-            print("Warning: pandas and pyarrow required for Parquet export.")
-            print("Install with: pip install pandas pyarrow")
-            # Fallback to JSON
-            self._save_episode_json(episode)
-            return
+    def _close_videos(self):
+        """Finish the current episode's camera videos."""
+        for camera_name, writer in self._video_writers.items():
+            if writer.close():
+                print(f"✓ Saved video ({writer.fourcc}): {writer.path}")
+            elif writer.error:
+                print(f"✗ Video for {camera_name} not written: {writer.error}")
+            else:
+                print(f"⚠ No frames captured from {camera_name}, no video written")
+        self._video_writers = {}
+    
+    def _episode_data_path(self, episode: Episode) -> Path:
+        """Path of the Parquet (or Feather) data file for an episode."""
+        return self.dataset_path / "data" / "chunk-000" / f"episode_{episode.episode_index:06d}.{self.write_format}"
+    
+    def _episode_video_path(self, episode: Episode, camera_name: str) -> Path:
+        """Path of an episode's MP4 file for one camera."""
+        return (self.dataset_path / "videos" / "chunk-000" /
+                f"episode_{episode.episode_index:06d}_observation.{camera_name}.mp4")
+    
+    def _allocate_row_buffer(self):
+        """
+        Fix the Parquet data columns and preallocate their row buffers.
         
-        # Prepare data for Parquet
-        data_dict = {
-            "episode_index": [],
-            "frame_index": [],
-            "timestamp": []
+        The columns follow from which arms are connected, so they are known
+        before the first frame. Each column is a NumPy array with one row per
+        frame, filled by record_frame with a single assignment per value, so
+        flushing needs no per-frame conversion. With pyarrow, two sets are
+        allocated so recording continues in one while the other is being
+        written; without it, the buffers grow to hold the whole episode for
+        the JSON fallback. Camera images are not stored in Parquet.
+        
+        Each arm also gets a boolean validity array; rows where its read
+        failed are written as nulls in all of the arm's columns.
+        """
+        rows = self.row_group_size
+        buffer = {
+            "episode_index": np.empty(rows, dtype=np.int64),
+            "frame_index": np.empty(rows, dtype=np.int64),
+            "timestamp": np.empty(rows, dtype=np.float64),
         }
+        for arm_name, dof in self._arm_dof.items():
+            (k_qpos, k_pos, k_euler, k_gripper,
+             k_action_qpos, k_action_gripper, k_state_qpos) = _ARM_COLUMNS[arm_name]
+            for key in (k_qpos, k_action_qpos, k_state_qpos):
+                buffer[key] = np.empty((rows, dof), dtype=np.float32)
+            buffer[k_pos] = np.empty((rows, 3), dtype=np.float32)
+            buffer[k_euler] = np.empty((rows, 3), dtype=np.float32)
+            buffer[k_gripper] = np.empty(rows, dtype=np.float32)
+            buffer[k_action_gripper] = np.empty(rows, dtype=np.float32)
         
-        # Collect all unique keys from observations, actions, states
-        # Exclude image keys (images are saved separately, not in Parquet)
-        all_keys = set()
-        for frame in episode.frames:
-            for key in frame.observation.keys():
-                # Skip image keys (numpy arrays)
-                if not isinstance(frame.observation[key], np.ndarray):
-                    all_keys.add(key)
-            all_keys.update(frame.action.keys())
-            all_keys.update(frame.state.keys())
-        
-        # Initialize columns
-        for key in all_keys:
-            data_dict[key] = []
-        
-        # Fill data
-        for frame in episode.frames:
-            data_dict["episode_index"].append(episode.episode_index)
-            data_dict["frame_index"].append(frame.index)
-            data_dict["timestamp"].append(frame.timestamp)
-            
-            # Add all data (excluding images)
-            for key in all_keys:
-                value = None
-                if key in frame.observation:
-                    value = frame.observation[key]
-                elif key in frame.action:
-                    value = frame.action[key]
-                elif key in frame.state:
-                    value = frame.state[key]
-                
-                # Convert lists to tuples for Parquet
-                if isinstance(value, list):
-                    value = tuple(value)
-                
-                data_dict[key].append(value)
+        self._pq_columns = sorted(key for key in buffer if key not in INDEX_COLUMNS)
+        # Data column -> validity array of the arm it belongs to
+        self._pq_validity = {
+            key: _ARM_VALID[arm_name] for arm_name in self._arm_dof for key in _ARM_COLUMNS[arm_name]
+        }
+        for arm_name in self._arm_dof:
+            buffer[_ARM_VALID[arm_name]] = np.empty(rows, dtype=np.bool_)
+        self._pq_buffer = buffer
+        self._pq_rows = 0
+        if HAS_PYARROW:
+            self._pq_spare = {name: np.empty_like(column) for name, column in buffer.items()}
+            self._pq_schema = self._build_schema()
+            row_bytes = sum(column.nbytes for column in buffer.values()) // rows
+            group_kb = row_bytes * rows / 1024
+            print(f"Parquet row groups: {rows} frames "
+                  f"(~{row_bytes} B/frame, ~{group_kb:.0f} KB uncompressed, double buffered)")
+    
+    def _grow_row_buffer(self):
+        """Double the capacity of the column buffers, keeping the filled rows."""
+        for name, column in self._pq_buffer.items():
+            grown = np.empty((2 * len(column),) + column.shape[1:], dtype=column.dtype)
+            grown[:len(column)] = column
+            self._pq_buffer[name] = grown
+    
+    def _build_schema(self):
+        """
+        Build the Arrow schema from the column buffers.
         
-        # Create DataFrame
-        df = pd.DataFrame(data_dict)
+        Vector columns are fixed-size lists of their NumPy dtype, so the
+        column order and types are the same in every episode file. Arm
+        columns are nullable (null where the arm read failed); the index
+        columns are always set.
+        """
+        fields = []
+        for name in (*INDEX_COLUMNS, *self._pq_columns):
+            column = self._pq_buffer[name]
+            value_type = pa.from_numpy_dtype(column.dtype)
+            if column.ndim > 1:
+                value_type = pa.list_(value_type, column.shape[1])
+            fields.append(pa.field(name, value_type, nullable=name not in INDEX_COLUMNS))
+        return pa.schema(fields)
+    
+    def _flush_episode_rows(self, episode: Episode):
+        """
+        Hand the buffered rows to the writer thread as one row group.
+        
+        The writer is opened on the first flush of each episode.
+        Encoding and compression run on the writer thread while recording
+        continues in the spare buffer.
+        """
+        rows = self._pq_rows
+        if rows == 0:
+            return
         
-        # Save as Parquet
-        output_file = self.dataset_path / "data" / "chunk-000" / f"episode_{episode.episode_index:06d}.parquet"
-        df.to_parquet(output_file, engine='pyarrow', compression='snappy')
-        print(f"✓ Saved episode data: {output_file}")
+        # Null masks per arm, only for arms that had failed reads in this row group
+        masks = {}
+        for valid_key in set(self._pq_validity.values()):
+            valid = self._pq_buffer[valid_key][:rows]
+            if not valid.all():
+                masks[valid_key] = ~valid
+        
+        # Wrap the filled rows without copying: vector columns become
+        # fixed-size lists over the flattened (rows x D) array
+        names = [*INDEX_COLUMNS, *self._pq_columns]
+        arrays = []
+        for name in names:
+            column = self._pq_buffer[name][:rows]
+            mask = masks.get(self._pq_validity.get(name))
+            if column.ndim == 1:
+                arrays.append(pa.array(column, mask=mask))
+            else:
+                arrays.append(pa.FixedSizeListArray.from_arrays(
+                    pa.array(column.ravel()), column.shape[1],
+                    mask=None if mask is None else pa.array(mask)
+                ))
+        
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self._pq_schema)
+        
+        if self._pq_writer is None:
+            self._pq_file = open(self._episode_data_path(episode), 'wb', buffering=_WRITE_BUFFER_SIZE)
+            if self.write_format == "feather":
+                codec = None if self.compression == "none" else pa.Codec(
+                    self.compression, compression_level=self.compression_level
+                )
+                self._pq_writer = pa.ipc.new_file(
+                    self._pq_file, self._pq_schema,
+                    options=pa.ipc.IpcWriteOptions(compression=codec)
+                )
+            else:
+                self._pq_writer = pq.ParquetWriter(
+                    self._pq_file, self._pq_schema,
+                    **parquet_writer_options(self.compression, self.compression_level)
+                )
+        
+        # The previous write still reads from the spare buffer; wait for it
+        # (and surface its errors) before that buffer is reused
+        if self._pq_pending is not None:
+            self._pq_pending.result()
+        self._pq_pending = self._pq_pool.submit(self._write_row_group, batch)
+        self._pq_buffer, self._pq_spare = self._pq_spare, self._pq_buffer
+        self._pq_rows = 0
+    
+    def _write_row_group(self, batch):
+        """Write one row group on the writer thread."""
+        self._pq_writer.write_batch(batch)
+        # Hand each row group to the OS so a crash loses at most one row group
+        self._pq_file.flush()
+    
+    def _save_episode_parquet(self, episode: Episode):
+        """Save episode data in LeRobot v3 format."""
+        self._flush_episode_rows(episode)
+        if self._pq_pending is not None:
+            self._pq_pending.result()
+            self._pq_pending = None
+        
+        # Finish the episode file streamed during recording
+        if self._pq_writer is not None:
+            self._pq_writer.close()
+            self._pq_writer = None
+            self._pq_file.flush()
+            os.fsync(self._pq_file.fileno())
+            self._pq_file.close()
+            self._pq_file = None
+            print(f"✓ Saved episode data: {self._episode_data_path(episode)}")
+        else:
+            print(f"⚠ Episode {episode.episode_index} has no frames, no data file written")
         
         # Save episode metadata to episodes.jsonl
-        metadata_file = self.dataset_path / "meta" / "episodes.jsonl"
-        with open(metadata_file, 'a') as f:
-            episode_meta = {
-                "episode_index": episode.episode_index,
-                "task": episode.task,
-                "task_index": episode.task_index,
-                "length": len(episode.frames),
-                "start_time": episode.start_time,
-                "end_time": episode.end_time,
-                "duration": episode.duration
-            }
-            f.write(json.dumps(episode_meta) + "\n")
+        episode_meta = {
+            "episode_index": episode.episode_index,
+            "task": episode.task,
+            "task_index": episode.task_index,
+            "length": episode.num_frames,
+            "start_time": episode.start_time,
+            "end_time": episode.end_time,
+            "duration": episode.duration
+        }
+        self._episodes_jsonl.write(_dumps_line(episode_meta))
+        self._episodes_jsonl.flush()
     
     def _save_episode_json(self, episode: Episode):
-        """Fallback: Save episode as JSON."""
-        output_file = self.dataset_path / "data" / "chunk-000" / f"episode_{episode.episode_index:06d}.json"
-        with open(output_file, 'w') as f:
-            json.dump(episode.to_dict(), f, indent=2)
-        print(f"✓ Saved episode data (JSON): {output_file}")
+        """
+        Fallback: Save episode as newline-delimited JSON.
+        
+        The first line holds the episode metadata, followed by one line per
+        frame, built from the column buffers that held the whole episode.
+        An arm whose read failed in a frame has null values in that frame.
+        Camera images are not included (they are in videos/).
+        """
+        output_file = self.dataset_path / "data" / "chunk-000" / f"episode_{episode.episode_index:06d}.jsonl"
+        header = episode.to_dict()
+        header.pop("frames")
+        
+        # One tolist() per column instead of per value
+        rows = self._pq_rows
+        columns = {name: self._pq_buffer[name][:rows].tolist() for name in self._pq_buffer}
+        groups = {
+            group: [key for key in self._pq_columns if key.startswith(f"{group}.")]
+            for group in ("observation", "action", "state")
+        }
+        timestamps = columns["timestamp"]
+        indices = columns["frame_index"]
+        
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_dumps_line(header))
+            for i in range(rows):
+                record = {"timestamp": timestamps[i], "index": indices[i]}
+                for group, keys in groups.items():
+                    record[group] = {
+                        key: columns[key][i] if columns[self._pq_validity[key]][i] else None
+                        for key in keys
+                    }
+                f.write(_dumps_line(record))
+            f.flush()
+            os.fsync(f.fileno())
+        self._pq_rows = 0
+        print(f"✓ Saved episode data (JSONL): {output_file}")
     
-    def save_dataset_info(self):
-        """Save dataset-level metadata."""
+    def _write_dataset_info(self) -> Path:
+        """
+        Write meta/info.json for the episodes saved so far.
+        
+        The file is written under a temporary name and renamed, so a crash
+        leaves either the previous or the new version.
+        """
         self.dataset_metadata["num_episodes"] = len(self.episodes)
-        self.dataset_metadata["total_frames"] = sum(len(ep.frames) for ep in self.episodes)
+        self.dataset_metadata["total_frames"] = sum(ep.num_frames for ep in self.episodes)
         
         info_file = self.dataset_path / "meta" / "info.json"
-        with open(info_file, 'w') as f:
-            json.dump(self.dataset_metadata, f, indent=2)
+        tmp_file = info_file.with_name("info.json.tmp")
+        with open(tmp_file, 'wb') as f:
+            _dump_json(self.dataset_metadata, f)
+        os.replace(tmp_file, info_file)
+        return info_file
+    
+    def save_dataset_info(self):
+        """Save dataset-level metadata."""
+        info_file = self._write_dataset_info()
+        self._episodes_jsonl.flush()
         
         print(f"✓ Saved dataset info: {info_file}")
     
@@ -576,6 +1133,17 @@ class LeRobotRecorder:
         if self.robot_right:
             self.robot_right.rm_delete_robot_arm()
         
+        # Stop the arm I/O and Parquet writer workers
+        self._io_pool.shutdown(wait=True)
+        self._gripper_pool.shutdown(wait=True)
+        self._pq_pool.shutdown(wait=True)
+        
+        if not self._episodes_jsonl.closed:
+            self._episodes_jsonl.close()
+        
+        # Finish videos of an episode that was not ended
+        self._close_videos()
+        
         # Close all cameras
         if self.cv2_caps:
             print("Closing cameras...")
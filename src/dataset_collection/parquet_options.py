@@ -0,0 +1,45 @@
+"""
+Episode file formats and Parquet writer options for LeRobot v3 datasets.
+
+Kept free of the arm SDK, OpenCV and pyarrow, so the recorder and the
+offline Feather-to-Parquet converter share one definition.
+"""
+
+from typing import Any, Dict, Optional
+
+# Parquet codecs accepted for episode files, and those that take a level
+PARQUET_CODECS = ("zstd", "snappy", "lz4", "gzip", "brotli", "none")
+LEVELED_CODECS = ("zstd", "gzip", "brotli")
+
+# Episode file formats. Feather (Arrow IPC) skips Parquet's encoding step, which
+# leaves more CPU for the recording loop; convert_to_parquet repacks it later.
+WRITE_FORMATS = ("parquet", "feather")
+# Codecs supported by Arrow IPC buffer compression
+FEATHER_CODECS = ("zstd", "lz4", "none")
+
+# Per-frame bookkeeping columns, written ahead of the arm columns. Only these
+# get Parquet statistics; min/max over float sensor pages is never used to
+# prune reads and costs CPU on every page.
+INDEX_COLUMNS = ("episode_index", "frame_index", "timestamp")
+
+
+def parquet_writer_options(compression: str, compression_level: Optional[int]) -> Dict[str, Any]:
+    """
+    ParquetWriter keyword arguments for episode files.
+
+    Dictionary encoding only pays off for episode_index, which is constant
+    and collapses to a single run; float sensor values are practically all
+    distinct. V2 data pages skip the per-page definition-level compression
+    and decode faster downstream.
+
+    Args:
+        compression: Codec, one of PARQUET_CODECS
+        compression_level: Codec level for zstd/gzip/brotli (ignored otherwise)
+    """
+    return {
+        "compression": compression,
+        "compression_level": compression_level if compression in LEVELED_CODECS else None,
+        "use_dictionary": ["episode_index"],
+        "write_statistics": list(INDEX_COLUMNS),
+        "data_page_version": "2.0",
+    }
@@ -4,13 +4,136 @@ CLI for recording LeRobot v3 format datasets.
 """
 
 import argparse
+import os
+import queue
+import select
+import signal
 import sys
+import threading
 from pathlib import Path
+from typing import Callable, Optional
+
+try:
+    import termios
+    import tty
+except ImportError:  # Not available on Windows
+    termios = None
+
+# select() only accepts sockets on Windows; stdin is read on a thread there
+_SELECT_STDIN = sys.platform != "win32"
+
+# Lines read from stdin by the fallback reader thread (None at EOF)
+_stdin_lines: "queue.Queue[Optional[str]]" = queue.Queue()
+_stdin_reader: Optional[threading.Thread] = None
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.dataset_collection.lerobot_recorder import LeRobotRecorder
+from src.dataset_collection.parquet_options import FEATHER_CODECS, PARQUET_CODECS, WRITE_FORMATS
+
+
+def _read_stdin_lines():
+    """Reader thread for platforms without select() on stdin."""
+    for line in sys.stdin:
+        _stdin_lines.put(line)
+    _stdin_lines.put(None)
+
+
+def _start_stdin_reader():
+    """Start the stdin reader thread once; it outlives each wait, so no line is lost."""
+    global _stdin_reader
+    if _stdin_reader is None:
+        _stdin_reader = threading.Thread(target=_read_stdin_lines, daemon=True, name="stdin-reader")
+        _stdin_reader.start()
+
+
+def wait_for_stop(prompt: str, done: Optional[Callable[[], bool]] = None) -> bool:
+    """
+    Wait until the user presses Enter or the process receives SIGINT/SIGTERM.
+    
+    Stdin is polled with select() instead of blocking in input(), so signals
+    are handled promptly. On a terminal, stdin is switched to cbreak mode
+    while waiting, so Enter is seen as soon as it is pressed rather than
+    after the terminal's line processing and echo. Where select() cannot
+    wait on stdin (Windows), a daemon thread reads the lines instead. If
+    stdin is closed (e.g. when embedded in another pipeline), only signals
+    stop the wait.
+    
+    Args:
+        prompt: Message shown to the user
+        done: Optional check polled while waiting; the wait ends once it returns True
+        
+    Returns:
+        True if the wait was ended by a signal, False if Enter was pressed
+    """
+    stop_event = threading.Event()
+    received = []
+    
+    def handle_signal(signum, frame):
+        received.append(signum)
+        stop_event.set()
+    
+    previous_handlers = {
+        sig: signal.signal(sig, handle_signal) for sig in (signal.SIGINT, signal.SIGTERM)
+    }
+    print(prompt)
+    
+    fd = None
+    saved_tty = None
+    if not _SELECT_STDIN:
+        _start_stdin_reader()
+    elif termios is not None and sys.stdin.isatty():
+        fd = sys.stdin.fileno()
+        saved_tty = termios.tcgetattr(fd)
+        # Unbuffered input without echo; Ctrl+C still raises SIGINT
+        tty.setcbreak(fd)
+    try:
+        watch_stdin = True
+        while not stop_event.is_set():
+            if done is not None and done():
+                break
+            if not watch_stdin:
+                stop_event.wait(0.1)
+                continue
+            if not _SELECT_STDIN:
+                try:
+                    line = _stdin_lines.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if line is not None:
+                    break
+                # EOF: stdin is closed, keep waiting for a signal only
+                watch_stdin = False
+                continue
+            ready, _, _ = select.select([sys.stdin], [], [], 0.1)
+            if not ready:
+                continue
+            if fd is not None:
+                try:
+                    data = os.read(fd, 64)
+                except OSError:  # EIO once the terminal has hung up
+                    data = b""
+                # Other keys are read and ignored
+                if any(c in b"\r\n" for c in data):
+                    break
+                if data:
+                    continue
+            elif sys.stdin.readline():
+                break
+            # EOF: stdin is closed (or the terminal hung up), keep waiting
+            # for a signal only instead of spinning on a readable fd
+            watch_stdin = False
+    finally:
+        if saved_tty is not None:
+            try:
+                termios.tcsetattr(fd, termios.TCSADRAIN, saved_tty)
+            except termios.error:
+                pass  # The terminal is gone
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+    
+    return bool(received)
 
 
 def main():
@@ -39,6 +162,20 @@ Examples:
     --num-episodes 5 \\
     --camera /dev/video0 --camera 1
   
+  # Record fixed-length 10 second episodes
+  python -m src.dataset_collection.record_dataset \\
+    --dataset-name timed_demo \\
+    --task "Pick and place" \\
+    --num-episodes 5 \\
+    --duration 10
+  
+  # Record to Arrow IPC files, then repack them as Parquet
+  python -m src.dataset_collection.record_dataset \\
+    --dataset-name fast_write \\
+    --task "Pick and place" \\
+    --write-format feather --compression lz4
+  python -m src.dataset_collection.convert_to_parquet ./lerobot_data/fast_write
+  
   # Record with custom IPs and FPS
   python -m src.dataset_collection.record_dataset \\
     --dataset-name high_speed_demo \\
@@ -52,6 +189,8 @@ Usage:
   2. When prompted, perform the task
   3. Press Enter to stop recording the episode
   4. Repeat for remaining episodes
+  
+  Ctrl+C (SIGINT) or SIGTERM saves the current episode and ends the session.
         """
     )
     
@@ -64,6 +203,9 @@ Usage:
                         help="Description of the task being performed")
     parser.add_argument("--num-episodes", type=int, default=1,
                         help="Number of episodes to record (default: 1)")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="Fixed episode length in seconds; recording stops automatically "
+                             "(default: record until ENTER is pressed)")
     
     # Robot configuration
     parser.add_argument("--robot-type", type=str, default="realman_dual_arm",
@@ -79,12 +221,28 @@ Usage:
     parser.add_argument("--arm2-port", type=int, default=8080,
                         help="Right arm port (default: 8080)")
     
+    parser.add_argument("--realtime", action="store_true",
+                        help="Pin the recording thread to a CPU and use SCHED_FIFO (Linux, needs CAP_SYS_NICE)")
+    parser.add_argument("--realtime-cpu", type=int, default=None,
+                        help="CPU to pin the recording thread to with --realtime (default: highest-numbered CPU)")
+    parser.add_argument("--compression", type=str, choices=PARQUET_CODECS, default="zstd",
+                        help="Episode file compression codec; feather supports zstd, lz4 and none (default: zstd)")
+    parser.add_argument("--compression-level", type=int, default=1,
+                        help="Compression level for zstd/gzip/brotli (default: 1)")
+    parser.add_argument("--write-format", type=str, choices=WRITE_FORMATS, default="parquet",
+                        help="Episode file format (default: parquet). feather writes Arrow IPC, which is "
+                             "cheaper during recording; repack with convert_to_parquet")
+    
     # Camera configuration
     parser.add_argument("--camera", type=str, action="append",
                         help="Camera source (can be used multiple times). "
                              "Examples: /dev/video0, /dev/video2, or numeric index 0, 1, etc.")
     
     args = parser.parse_args()
+    if args.duration is not None and not args.duration > 0:
+        parser.error(f"--duration must be positive, got {args.duration:g}")
+    if args.write_format == "feather" and args.compression not in FEATHER_CODECS:
+        parser.error(f"--write-format feather supports --compression {', '.join(FEATHER_CODECS)}")
     
     # Parse camera sources (convert numeric strings to int, keep paths as str)
     cameras = []
@@ -104,6 +262,8 @@ Usage:
     print(f"Task: {args.task}")
     print(f"Episodes: {args.num_episodes}")
     print(f"FPS: {args.fps}")
+    if args.duration is not None:
+        print(f"Episode duration: {args.duration:g}s")
     if cameras:
         print(f"Cameras: {cameras}")
     print(f"{'='*70}\n")
@@ -117,7 +277,12 @@ Usage:
         arm1_port=args.arm1_port,
         arm2_ip=args.arm2_ip,
         arm2_port=args.arm2_port,
-        cameras=cameras
+        cameras=cameras,
+        realtime=args.realtime,
+        realtime_cpu=args.realtime_cpu,
+        compression=args.compression,
+        compression_level=args.compression_level,
+        write_format=args.write_format
     )
     
     try:
@@ -138,16 +303,25 @@ Usage:
             recorder.start_episode(task=args.task, task_index=0)
             
             # Start recording
-            recorder.start_recording()
+            recorder.start_recording(duration=args.duration)
             
-            # Wait for user to press Enter
-            input("\nPerform the task. Press ENTER when done...\n")
+            # Wait for user to press Enter (or for SIGINT/SIGTERM, or the fixed duration)
+            if args.duration is None:
+                prompt = "\nPerform the task. Press ENTER when done...\n"
+            else:
+                prompt = f"\nPerform the task. Recording stops after {args.duration:g}s (or press ENTER)...\n"
+            interrupted = wait_for_stop(prompt, done=lambda: not recorder.recording)
             
             # Stop recording
             recorder.stop_recording()
             
             # End episode
             recorder.end_episode()
+            
+            if interrupted:
+                print("\n\nRecording interrupted by user")
+                recorder.save_dataset_info()
+                return 1
         
         # Save dataset metadata
         recorder.save_dataset_info()
@@ -159,7 +333,7 @@ Usage:
         print(f"Dataset: {args.dataset_name}")
         print(f"Location: {recorder.dataset_path}")
         print(f"Episodes: {len(recorder.episodes)}")
-        total_frames = sum(len(ep.frames) for ep in recorder.episodes)
+        total_frames = sum(ep.num_frames for ep in recorder.episodes)
         print(f"Total frames: {total_frames}")
         print(f"{'='*70}\n")
         
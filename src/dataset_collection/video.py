@@ -0,0 +1,127 @@
+"""Background MP4 encoding of camera streams for LeRobot v3 datasets."""
+
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Optional, Set, Tuple
+
+import cv2
+import numpy as np
+
+# Codecs tried in order: H.264 where OpenCV's FFmpeg build supports it, else MPEG-4 Part 2
+_FOURCCS = ("avc1", "mp4v")
+
+
+class CameraVideoWriter:
+    """
+    Encode one camera's frames to an MP4 file on a background thread.
+
+    The recording thread only puts frames on a bounded queue; opening the
+    encoder and encoding happen on the writer thread. The writer is opened
+    with the size of the first frame. When the queue is full, write() blocks
+    instead of dropping, and failed captures are filled in, so video frames
+    stay aligned with the Parquet frame_index.
+    """
+
+    def __init__(self, path: Path, fps: int, queue_size: int = 8, cpus: Optional[Set[int]] = None,
+                 frame_size: Optional[Tuple[int, int]] = None):
+        """
+        Start the writer thread for one video file.
+
+        Args:
+            path: Output .mp4 path
+            fps: Frame rate stored in the video
+            queue_size: Frames buffered between the recording and writer threads
+            cpus: CPUs to pin the writer thread to (Linux; default: no pinning)
+            frame_size: Camera (width, height), used for black frames when
+                captures fail before the first frame (default: the first
+                frame's size, with the black frames queued once it arrives)
+        """
+        self.path = Path(path)
+        self.fps = fps
+        self.cpus = cpus
+        self.fourcc: Optional[str] = None  # Codec in use, set when the encoder opens
+        self.frames_written = 0
+        self.error: Optional[str] = None
+        self._queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=queue_size)
+        self._last_frame: Optional[np.ndarray] = None
+        if frame_size is not None:
+            width, height = frame_size
+            self._last_frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self._missed_leading = 0  # Failed captures before any frame, when the size is unknown
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name=f"video-{self.path.stem}"
+        )
+        self._thread.start()
+
+    def write(self, frame: Optional[np.ndarray]):
+        """
+        Queue a BGR frame for encoding.
+
+        Args:
+            frame: Camera frame, or None if the capture failed. A failed
+                capture repeats the previous frame, or a black frame before
+                the first one, to keep the video aligned.
+        """
+        if frame is None:
+            frame = self._last_frame
+            if frame is None:
+                self._missed_leading += 1
+                return
+        elif self._missed_leading:
+            black = np.zeros_like(frame)
+            for _ in range(self._missed_leading):
+                self._queue.put(black)
+            self._missed_leading = 0
+        self._last_frame = frame
+        self._queue.put(frame)
+
+    def close(self) -> bool:
+        """
+        Encode the remaining frames and finish the file.
+
+        Returns:
+            True if the video was written without errors
+        """
+        self._queue.put(None)
+        self._thread.join()
+        return self.error is None and self.frames_written > 0
+
+    def _open(self, frame: np.ndarray) -> Optional[cv2.VideoWriter]:
+        """Open the encoder for the first frame's size, trying each codec in turn."""
+        height, width = frame.shape[:2]
+        for fourcc in _FOURCCS:
+            writer = cv2.VideoWriter(
+                str(self.path), cv2.VideoWriter_fourcc(*fourcc), self.fps, (width, height)
+            )
+            if writer.isOpened():
+                self.fourcc = fourcc
+                return writer
+            writer.release()
+        self.error = f"no MP4 encoder available (tried {', '.join(_FOURCCS)})"
+        return None
+
+    def _run(self):
+        """Writer thread: encode queued frames until close() sends the end marker."""
+        if self.cpus:
+            try:
+                os.sched_setaffinity(0, self.cpus)
+            except (AttributeError, OSError):
+                pass
+        writer = None
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            if self.error is not None:
+                # Keep draining so write() never blocks on a failed encoder
+                continue
+            if writer is None:
+                writer = self._open(frame)
+                if writer is None:
+                    continue
+            writer.write(frame)
+            self.frames_written += 1
+        if writer is not None:
+            writer.release()
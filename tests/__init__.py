@@ -0,0 +1 @@
+"""Tests for R2D3 Python. Run with: python -m unittest discover -s tests -t ."""
@@ -0,0 +1,82 @@
+"""
+In-process stand-in for the Realman SDK (Robotic_Arm.rm_robot_interface).
+
+install() registers it in sys.modules, so the recorder and controller can be
+imported and exercised without the vendor library or arms. Tests steer it
+through the FakeRoboticArm class attributes and call reset() between tests.
+"""
+
+import sys
+import time
+import types
+
+
+class rm_thread_mode_e:
+    RM_TRIPLE_MODE_E = 2
+
+
+class FakeHandle:
+    """Arm handle as returned by rm_create_robot_arm (id -1 on failure)."""
+
+    def __init__(self, arm_id: int):
+        self.id = arm_id
+
+
+class FakeRoboticArm:
+    """RoboticArm with canned 7-DOF states."""
+
+    # IPs whose rm_create_robot_arm fails (returns a handle with id -1)
+    unreachable = set()
+    # IPs whose rm_get_current_arm_state returns an error code
+    failing_state = set()
+    # Number of successful rm_create_robot_arm calls
+    connects = 0
+    # Seconds each rm_get_current_arm_state call takes
+    state_delay = 0.0
+
+    joints_deg = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0]
+    pose = [0.1, 0.2, 0.3, 0.01, 0.02, 0.03]
+    gripper = 500
+
+    def __init__(self, mode=None):
+        self.ip = None
+
+    @classmethod
+    def reset(cls):
+        cls.unreachable = set()
+        cls.failing_state = set()
+        cls.connects = 0
+        cls.state_delay = 0.0
+
+    def rm_create_robot_arm(self, ip, port):
+        self.ip = ip
+        if ip in FakeRoboticArm.unreachable:
+            return FakeHandle(-1)
+        FakeRoboticArm.connects += 1
+        return FakeHandle(FakeRoboticArm.connects)
+
+    def rm_get_current_arm_state(self):
+        if FakeRoboticArm.state_delay:
+            time.sleep(FakeRoboticArm.state_delay)
+        if self.ip in FakeRoboticArm.failing_state:
+            return 1, {}
+        return 0, {"joint": list(self.joints_deg), "pose": list(self.pose)}
+
+    def rm_get_gripper_state(self):
+        return 0, {"position": self.gripper}
+
+    def rm_delete_robot_arm(self):
+        return 0
+
+
+def install():
+    """Register the fake SDK as Robotic_Arm.rm_robot_interface."""
+    interface = types.ModuleType("Robotic_Arm.rm_robot_interface")
+    interface.RoboticArm = FakeRoboticArm
+    interface.rm_thread_mode_e = rm_thread_mode_e
+    interface.__all__ = ["RoboticArm", "rm_thread_mode_e"]
+    package = types.ModuleType("Robotic_Arm")
+    package.__path__ = []
+    package.rm_robot_interface = interface
+    sys.modules["Robotic_Arm"] = package
+    sys.modules["Robotic_Arm.rm_robot_interface"] = interface
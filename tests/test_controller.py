@@ -0,0 +1,58 @@
+"""Tests for DualArmController, run against the fake SDK in tests/fake_sdk.py."""
+
+import contextlib
+import io
+import unittest
+
+from tests import fake_sdk
+
+fake_sdk.install()
+
+from src.arm_control.controller import DualArmController, _ArmSession
+
+ARM1_IP = "10.0.0.1"
+ARM2_IP = "10.0.0.2"
+
+
+class TestArmSessionCache(unittest.TestCase):
+    def setUp(self):
+        fake_sdk.FakeRoboticArm.reset()
+        _ArmSession._sessions.clear()
+        self.addCleanup(_ArmSession._sessions.clear)
+        self._quiet = contextlib.redirect_stdout(io.StringIO())
+        self._quiet.__enter__()
+        self.addCleanup(self._quiet.__exit__, None, None, None)
+
+    def make_controller(self) -> DualArmController:
+        return DualArmController(arm1_ip=ARM1_IP, arm2_ip=ARM2_IP)
+
+    def test_failed_connect_is_not_cached(self):
+        fake_sdk.FakeRoboticArm.unreachable.add(ARM1_IP)
+        controller = self.make_controller()
+        self.assertFalse(controller.connect())
+        self.assertIsNone(_ArmSession.get(ARM1_IP, 8080))
+
+        # A later controller must not reuse the failed handle
+        self.assertFalse(self.make_controller().connect())
+
+    def test_reconnect_after_failure(self):
+        fake_sdk.FakeRoboticArm.unreachable.add(ARM1_IP)
+        self.assertFalse(self.make_controller().connect())
+
+        fake_sdk.FakeRoboticArm.unreachable.clear()
+        controller = self.make_controller()
+        self.assertTrue(controller.connect())
+        self.assertNotEqual(controller.arm1.id, -1)
+        self.assertIs(_ArmSession.get(ARM1_IP, 8080)[1], controller.arm1)
+
+    def test_successful_connect_is_reused(self):
+        first = self.make_controller()
+        self.assertTrue(first.connect())
+        second = self.make_controller()
+        self.assertTrue(second.connect())
+        self.assertIs(second.robot, first.robot)
+        self.assertEqual(fake_sdk.FakeRoboticArm.connects, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
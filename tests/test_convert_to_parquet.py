@@ -0,0 +1,65 @@
+"""Tests for the Feather to Parquet converter."""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Runs the converter with the arm SDK and OpenCV made unimportable
+_RUN_WITHOUT_SDK = """
+import runpy, sys
+sys.modules["Robotic_Arm"] = None
+sys.modules["Robotic_Arm.rm_robot_interface"] = None
+sys.modules["cv2"] = None
+sys.argv = ["convert_to_parquet", *sys.argv[1:]]
+runpy.run_module("src.dataset_collection.convert_to_parquet", run_name="__main__")
+"""
+
+
+class TestConvertWithoutSdk(unittest.TestCase):
+    def run_converter(self, *args) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-c", _RUN_WITHOUT_SDK, *args],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=60,
+        )
+
+    def test_help(self):
+        result = self.run_converter("--help")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("--compression", result.stdout)
+
+    def test_converts_feather_dataset(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            dataset = Path(tmp)
+            chunk = dataset / "data" / "chunk-000"
+            chunk.mkdir(parents=True)
+            (dataset / "meta").mkdir()
+            (dataset / "meta" / "info.json").write_text(json.dumps({"write_format": "feather"}))
+
+            table = pa.table({
+                "episode_index": pa.array([0, 0, 0], pa.int64()),
+                "frame_index": pa.array([0, 1, 2], pa.int64()),
+                "timestamp": pa.array([0.0, 0.1, 0.2], pa.float64()),
+            })
+            with pa.ipc.new_file(str(chunk / "episode_000000.feather"), table.schema) as writer:
+                writer.write_table(table)
+
+            result = self.run_converter(str(dataset))
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+            self.assertFalse((chunk / "episode_000000.feather").exists())
+            self.assertTrue(pq.read_table(chunk / "episode_000000.parquet").equals(table))
+            info = json.loads((dataset / "meta" / "info.json").read_text())
+            self.assertEqual(info["write_format"], "parquet")
+            self.assertEqual(info["compression"], "zstd")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+"""Tests for LeRobotRecorder, run against the fake SDK in tests/fake_sdk.py."""
+
+import contextlib
+import gc
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests import fake_sdk
+
+fake_sdk.install()
+
+import pyarrow.parquet as pq
+
+from src.dataset_collection import lerobot_recorder
+from src.dataset_collection.lerobot_recorder import LeRobotRecorder
+
+LEFT_IP = "10.0.0.1"
+RIGHT_IP = "10.0.0.2"
+
+
+class RecorderTestCase(unittest.TestCase):
+    """Creates a recorder in a temporary dataset directory, with output silenced."""
+
+    def setUp(self):
+        fake_sdk.FakeRoboticArm.reset()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self._quiet = contextlib.redirect_stdout(io.StringIO())
+        self.stdout = self._quiet.__enter__()
+        self.addCleanup(self._quiet.__exit__, None, None, None)
+
+    def make_recorder(self, **kwargs) -> LeRobotRecorder:
+        recorder = LeRobotRecorder(
+            "test", dataset_path=self._tmp.name, arm1_ip=LEFT_IP, arm2_ip=RIGHT_IP, **kwargs
+        )
+        self.addCleanup(recorder.disconnect)
+        self.assertTrue(recorder.connect())
+        return recorder
+
+    def record_three_frames_with_right_dropout(self, recorder: LeRobotRecorder):
+        """Record frames 0-2; the right arm's state read fails on frame 1."""
+        recorder.start_episode("task")
+        recorder.record_frame()
+        fake_sdk.FakeRoboticArm.failing_state.add(RIGHT_IP)
+        recorder.record_frame()
+        fake_sdk.FakeRoboticArm.failing_state.clear()
+        recorder.record_frame()
+        recorder.end_episode()
+
+
+class TestFailedArmReads(RecorderTestCase):
+    def test_failed_read_is_null_in_parquet(self):
+        recorder = self.make_recorder()
+        self.record_three_frames_with_right_dropout(recorder)
+
+        path = Path(self._tmp.name) / "test" / "data" / "chunk-000" / "episode_000000.parquet"
+        table = pq.read_table(path)
+        self.assertEqual(table.num_rows, 3)
+        for name in lerobot_recorder._ARM_COLUMNS["right"]:
+            values = table.column(name).to_pylist()
+            self.assertIsNone(values[1], name)
+            self.assertIsNotNone(values[0], name)
+            self.assertIsNotNone(values[2], name)
+        for name in lerobot_recorder._ARM_COLUMNS["left"]:
+            self.assertEqual(table.column(name).null_count, 0, name)
+
+        right_arm = table.column("observation.state.right_arm").to_pylist()
+        self.assertNotEqual(right_arm[0], [0.0] * 7)
+
+    def test_failed_read_is_null_in_json_fallback(self):
+        with mock.patch.object(lerobot_recorder, "HAS_PYARROW", False):
+            recorder = self.make_recorder()
+            self.record_three_frames_with_right_dropout(recorder)
+
+        path = Path(self._tmp.name) / "test" / "data" / "chunk-000" / "episode_000000.jsonl"
+        frames = [json.loads(line) for line in path.read_text().splitlines()[1:]]
+        self.assertEqual(len(frames), 3)
+        self.assertIsNone(frames[1]["observation"]["observation.state.right_arm"])
+        self.assertIsNone(frames[1]["action"]["action.right_gripper"])
+        self.assertIsNotNone(frames[1]["observation"]["observation.state.left_arm"])
+        self.assertIsNotNone(frames[0]["observation"]["observation.state.right_arm"])
+        self.assertNotIn("row groups", self.stdout.getvalue())
+
+
+class TestOverlappingArmReads(RecorderTestCase):
+    def test_concurrent_callers_do_not_deadlock(self):
+        recorder = self.make_recorder()
+        fake_sdk.FakeRoboticArm.state_delay = 0.05
+        results = []
+        callers = [
+            threading.Thread(target=lambda: results.append(recorder.read_arm_observations_parallel()),
+                             daemon=True)
+            for _ in range(4)
+        ]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join(timeout=5.0)
+        self.assertEqual(len(results), 4)
+        for observations in results:
+            self.assertEqual(observations["left"]["gripper_position"], 500)
+            self.assertEqual(observations["right"]["gripper_position"], 500)
+
+
+class TestStopRecording(RecorderTestCase):
+    def test_waits_for_a_stalled_frame(self):
+        recorder = self.make_recorder()
+        recorder.start_episode("task")
+        recorder.start_recording()
+        time.sleep(0.2)
+        # The frame in progress outlasts stop_recording's first join
+        fake_sdk.FakeRoboticArm.state_delay = 2.5
+        time.sleep(0.1)
+        recorder.stop_recording()
+        self.assertFalse(recorder.recording_thread.is_alive())
+        self.assertIn("still finishing a frame", self.stdout.getvalue())
+        recorder.end_episode()
+
+
+class TestRowGroupSize(RecorderTestCase):
+    def test_default_is_about_ten_seconds(self):
+        recorder = self.make_recorder(fps=20)
+        self.assertEqual(recorder.row_group_size, 200)
+        self.assertEqual(recorder.dataset_metadata["row_group_size"], 200)
+
+    def test_row_group_status_on_pyarrow_path(self):
+        recorder = self.make_recorder()
+        recorder.start_episode("task")
+        recorder.end_episode()
+        self.assertIn("double buffered", self.stdout.getvalue())
+
+
+class TestRealtimeGarbageCollection(RecorderTestCase):
+    def test_gc_is_restored_after_each_episode(self):
+        recorder = self.make_recorder(realtime=True)
+        # Some interpreters keep a few objects in the permanent generation
+        gc.collect()
+        baseline = gc.get_freeze_count()
+        for _ in range(3):
+            recorder.start_episode("task")
+            recorder.start_recording()
+            self.assertFalse(gc.isenabled())
+            self.assertGreater(gc.get_freeze_count(), baseline)
+            # Cyclic garbage created while the collector is paused
+            for _ in range(1000):
+                cycle = []
+                cycle.append(cycle)
+            time.sleep(0.1)
+            recorder.stop_recording()
+            recorder.end_episode()
+
+            self.assertTrue(gc.isenabled())
+            self.assertEqual(gc.get_freeze_count(), baseline)
+
+        # Stopping again (e.g. on interrupt) leaves the collector alone
+        recorder.stop_recording()
+        self.assertTrue(gc.isenabled())
+
+
+def _fifo_permitted() -> bool:
+    """Whether this process may use SCHED_FIFO (checked on a throwaway thread)."""
+    if not hasattr(os, "sched_setscheduler"):
+        return False
+    result = []
+
+    def probe():
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+            result.append(True)
+        except OSError:
+            result.append(False)
+
+    thread = threading.Thread(target=probe)
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+@unittest.skipUnless(_fifo_permitted(), "SCHED_FIFO not permitted")
+class TestRealtimeWorkerPriority(RecorderTestCase):
+    def test_parquet_writer_runs_under_normal_scheduler(self):
+        # Small row groups, so the writer thread is started from the realtime recording thread
+        recorder = self.make_recorder(realtime=True, row_group_size=2)
+        recorder.start_episode("task")
+        recorder.start_recording()
+        time.sleep(0.3)
+        recorder.stop_recording()
+        recorder.end_episode()
+
+        policy = recorder._pq_pool.submit(os.sched_getscheduler, 0).result()
+        self.assertEqual(policy, os.SCHED_OTHER)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Tests for the record_dataset CLI."""
+
+import io
+import os
+import queue
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tests import fake_sdk
+
+fake_sdk.install()
+
+from src.dataset_collection import record_dataset
+
+try:
+    import pty
+except ImportError:  # Not available on Windows
+    pty = None
+
+
+class TestWaitForStopWithoutSelect(unittest.TestCase):
+    """The Windows path: stdin is read by a thread instead of select()."""
+
+    def wait(self, stdin_text: str, done=None) -> bool:
+        with mock.patch.object(record_dataset, "_SELECT_STDIN", False), \
+                mock.patch.object(record_dataset, "_stdin_reader", None), \
+                mock.patch.object(record_dataset, "_stdin_lines", queue.Queue()), \
+                mock.patch.object(sys, "stdin", io.StringIO(stdin_text)), \
+                mock.patch.object(sys, "stdout", io.StringIO()):
+            return record_dataset.wait_for_stop("Press Enter", done)
+
+    def test_enter_stops_the_wait(self):
+        self.assertFalse(self.wait("\n"))
+
+    def test_closed_stdin_waits_for_done(self):
+        deadline = time.monotonic() + 0.3
+        self.assertFalse(self.wait("", done=lambda: time.monotonic() > deadline))
+        self.assertGreaterEqual(time.monotonic(), deadline)
+
+
+class TestArguments(unittest.TestCase):
+    def test_rejects_non_positive_duration(self):
+        for duration in ("0", "-5"):
+            argv = ["record_dataset", "--dataset-name", "d", "--task", "t", "--duration", duration]
+            with mock.patch.object(sys, "argv", argv), \
+                    mock.patch.object(sys, "stderr", io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as raised:
+                    record_dataset.main()
+            self.assertEqual(raised.exception.code, 2)
+            self.assertIn("--duration must be positive", stderr.getvalue())
+
+
+@unittest.skipIf(pty is None or record_dataset.termios is None, "needs a POSIX terminal")
+class TestWaitForStopOnTerminal(unittest.TestCase):
+    def test_hangup_does_not_spin(self):
+        master, slave = pty.openpty()
+        stdin = os.fdopen(slave, "r")
+        self.addCleanup(stdin.close)
+        # Hang up once the wait is in cbreak mode: the terminal stays
+        # readable, but reads return nothing
+        hangup = threading.Timer(0.1, os.close, (master,))
+        hangup.start()
+        self.addCleanup(hangup.join)
+
+        deadline = time.monotonic() + 0.5
+        cpu_start = time.process_time()
+        with mock.patch.object(sys, "stdin", stdin), mock.patch.object(sys, "stdout", io.StringIO()):
+            self.assertFalse(record_dataset.wait_for_stop(
+                "Press Enter", done=lambda: time.monotonic() > deadline
+            ))
+        self.assertLess(time.process_time() - cpu_start, 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
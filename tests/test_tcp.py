@@ -0,0 +1,46 @@
+"""Tests for TCP socket tuning of arm connections."""
+
+import contextlib
+import io
+import os
+import socket
+import unittest
+
+from tests import fake_sdk
+
+# Importing src.arm_control loads the controller, which needs the SDK
+fake_sdk.install()
+
+from src.arm_control.tcp import enable_tcp_nodelay
+
+
+@unittest.skipUnless(os.path.isdir("/proc/self/fd"), "needs /proc/self/fd")
+class TestEnableTcpNodelay(unittest.TestCase):
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(self.server.close)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.client = socket.create_connection(("127.0.0.1", self.port))
+        self.addCleanup(self.client.close)
+
+    def nodelay(self) -> int:
+        return self.client.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+    def test_hostname_is_resolved(self):
+        self.assertEqual(self.nodelay(), 0)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(enable_tcp_nodelay("localhost", self.port), 1)
+        self.assertNotEqual(self.nodelay(), 0)
+        self.assertEqual(out.getvalue(), "")
+
+    def test_warns_when_no_socket_matches(self):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(enable_tcp_nodelay("127.0.0.1", self.port + 1), 0)
+        self.assertIn("TCP_NODELAY not set", out.getvalue())
+        self.assertEqual(self.nodelay(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
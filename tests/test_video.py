@@ -0,0 +1,62 @@
+"""Tests for CameraVideoWriter."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from src.dataset_collection.video import CameraVideoWriter
+
+WIDTH, HEIGHT = 64, 48
+
+
+def read_frames(path: Path):
+    cap = cv2.VideoCapture(str(path))
+    frames = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+class TestFirstFrameFailure(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "camera.mp4"
+
+    def record_with_leading_failures(self, **kwargs):
+        """Two failed captures, then three white frames; returns the decoded frames."""
+        writer = CameraVideoWriter(self.path, 30, **kwargs)
+        writer.write(None)
+        writer.write(None)
+        white = np.full((HEIGHT, WIDTH, 3), 255, dtype=np.uint8)
+        for _ in range(3):
+            writer.write(white)
+        self.assertTrue(writer.close(), writer.error)
+        self.assertEqual(writer.frames_written, 5)
+        return read_frames(self.path)
+
+    def assert_black_then_white(self, frames):
+        self.assertEqual(len(frames), 5)
+        for frame in frames[:2]:
+            self.assertLess(frame.mean(), 32)
+        for frame in frames[2:]:
+            self.assertGreater(frame.mean(), 224)
+
+    def test_black_frames_at_configured_size(self):
+        frames = self.record_with_leading_failures(frame_size=(WIDTH, HEIGHT))
+        self.assertEqual(frames[0].shape, (HEIGHT, WIDTH, 3))
+        self.assert_black_then_white(frames)
+
+    def test_black_frames_without_configured_size(self):
+        self.assert_black_then_white(self.record_with_leading_failures())
+
+
+if __name__ == "__main__":
+    unittest.main()